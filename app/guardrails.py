@@ -7,10 +7,27 @@
 
 import os
 import sys
+import time
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from .errors import ErrorCode, fail_with_error, fail_stub_path_error, fail_config_error
 
 
+# Last formatted UTC timestamp, reused for calls within the same millisecond
+_TS_CACHE = {"mono": float("-inf"), "str": ""}
+
+
+def _rfc3339_ms() -> str:
+    """Current UTC time as RFC3339 with millisecond precision (cached per ms)."""
+    m = time.monotonic()
+    if m - _TS_CACHE["mono"] < 0.001:
+        return _TS_CACHE["str"]
+    s = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+    _TS_CACHE["mono"] = m
+    _TS_CACHE["str"] = s
+    return s
+
+
 def assert_no_stub():
     """Assert that stub code paths are not allowed in this environment."""
     # Default to FAIL_ON_STUB=1 (production mode) unless explicitly overridden
@@ -45,10 +62,46 @@ def require(condition: bool, code: str, msg: str):
             raise SystemExit(2)
 
 
+def _provenance_value(v: Any) -> Any:
+    """Render a provenance value: None -> N/A, booleans lowercase."""
+    if v is None:
+        return "N/A"
+    if isinstance(v, bool):
+        return "true" if v else "false"
+    return v
+
+
+# Standard field set produced by create_provenance_data (with optional keys present)
+_PROVENANCE_FIELDS = frozenset({
+    "data_source", "is_synthetic", "vwap_method",
+    "provider_request_id", "source_session", "timestamp",
+})
+
+
+def _format_provenance_line(kv: Dict[str, Any]) -> str:
+    """Format a provenance line; the standard field set uses a fixed template."""
+    if kv.keys() == _PROVENANCE_FIELDS:
+        v = _provenance_value
+        return (
+            f"[PROVENANCE] data_source={v(kv['data_source'])} "
+            f"is_synthetic={v(kv['is_synthetic'])} "
+            f"vwap_method={v(kv['vwap_method'])} "
+            f"provider_request_id={v(kv['provider_request_id'])} "
+            f"source_session={v(kv['source_session'])} "
+            f"timestamp={v(kv['timestamp'])}\n"
+        )
+    items = " ".join(f"{k}={_provenance_value(val)}" for k, val in kv.items())
+    return f"[PROVENANCE] {items}\n"
+
+
 def provenance_stderr(**kv):
-    """Write provenance information to STDERR for AI-block format."""
-    items = " ".join(f"{k}={v if v is not None else 'N/A'}" for k, v in kv.items())
-    print(f"PROVENANCE {items}", file=sys.stderr)
+    """Write provenance information to STDERR for AI-block format.
+
+    The full line (including newline) is assembled first and written with a
+    single call, so each emission is one write on the stderr stream rather
+    than separate writes for the payload and line terminator.
+    """
+    sys.stderr.write(_format_provenance_line(kv))
 
 
 def fail_fast(code: str, msg: str) -> None:
@@ -111,13 +164,11 @@ def create_provenance_data(
     source_session: Optional[str] = None
 ) -> Dict[str, Any]:
     """Create standardized provenance data structure."""
-    from datetime import datetime
-    
     provenance = {
         "data_source": provider,
         "is_synthetic": is_synthetic,
         "vwap_method": vwap_method,
-        "timestamp": datetime.utcnow().isoformat() + "Z"
+        "timestamp": _rfc3339_ms()
     }
     
     if provider_request_id:
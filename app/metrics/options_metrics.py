@@ -43,8 +43,11 @@ def _pcr(df: pd.DataFrame, type_col: str, value_col: str) -> Number:
     missing = [c for c in (type_col, value_col) if c not in df.columns]
     if missing:
         raise ValueError(f"Missing required columns for PCR: {missing}")
-    calls = pd.to_numeric(df.loc[df[type_col].str.lower() == "call", value_col], errors="coerce").sum()
-    puts = pd.to_numeric(df.loc[df[type_col].str.lower() == "put", value_col], errors="coerce").sum()
+    # Single grouped pass instead of one boolean scan per option type.
+    values = pd.to_numeric(df[value_col], errors="coerce")
+    sums = values.groupby(df[type_col].str.lower(), sort=False).sum()
+    calls = sums.get("call", 0)
+    puts = sums.get("put", 0)
     if calls == 0:
         return None
     return float(puts / calls)
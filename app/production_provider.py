@@ -9,14 +9,17 @@
 import asyncio
 import uuid
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Any, Optional, NamedTuple
+from typing import List, Dict, Any, Optional, NamedTuple, Sequence, Tuple
 import logging
 
+import numpy as np
+
 from .config import Config
 from .auth import AuthManager
 from .providers import schwab as S
 from .utils.futures import translate_root_to_front_month
 from .utils.futures_symbols import enhanced_translate_root_to_front_month, get_futures_info
+from .utils._njit import njit, NUMBA_AVAILABLE
 from .guardrails import require, assert_no_stub, create_provenance_data
 from .errors import (
     ErrorCode, fail_with_error, fail_auth_error, fail_no_daily_data,
@@ -46,6 +49,70 @@ class IntradayBar(NamedTuple):
     volume: int
 
 
+# Columnar (SoA) layout for intraday bars; IntradayBar stays the per-bar record type.
+BAR_DTYPE = np.dtype([
+    ('ts', 'datetime64[ns]'),
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+    ('volume', 'i8'),
+])
+
+
+def bars_to_structured(bars: Sequence[IntradayBar]) -> np.ndarray:
+    """Pack IntradayBar records into a single BAR_DTYPE structured array."""
+    out = np.empty(len(bars), dtype=BAR_DTYPE)
+    for i, bar in enumerate(bars):
+        ts = bar.timestamp
+        if isinstance(ts, datetime) and ts.tzinfo is not None:
+            ts = ts.replace(tzinfo=None) - ts.utcoffset()
+        out[i] = (np.datetime64(ts, 'ns'), bar.open, bar.high, bar.low, bar.close, bar.volume)
+    return out
+
+
+def bars_to_arrays(bars) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Split intraday bars into contiguous (high, low, close, volume) arrays.
+
+    Accepts either a BAR_DTYPE structured array (returns column views) or a
+    sequence of IntradayBar records.
+    """
+    if isinstance(bars, np.ndarray) and bars.dtype.names:
+        return bars['high'], bars['low'], bars['close'], bars['volume']
+    n = len(bars)
+    high = np.fromiter((b.high for b in bars), dtype=np.float64, count=n)
+    low = np.fromiter((b.low for b in bars), dtype=np.float64, count=n)
+    close = np.fromiter((b.close for b in bars), dtype=np.float64, count=n)
+    volume = np.fromiter((b.volume for b in bars), dtype=np.float64, count=n)
+    return high, low, close, volume
+
+
+@njit(cache=True, fastmath=True)
+def _vwap_kernel(high, low, close, volume):
+    """Single-pass typical-price VWAP loop; returns 0.0 when there is no volume."""
+    s_pv = 0.0
+    s_v = 0.0
+    for i in range(high.shape[0]):
+        tp = (high[i] + low[i] + close[i]) / 3.0
+        s_pv += tp * volume[i]
+        s_v += volume[i]
+    return s_pv / s_v if s_v > 0 else 0.0
+
+
+def vwap_from_arrays(high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray) -> Optional[float]:
+    """VWAP over typical price (H+L+C)/3; None when there is no volume.
+
+    Uses the compiled kernel when numba is installed, otherwise NumPy.
+    """
+    total_volume = volume.sum()
+    if NUMBA_AVAILABLE and total_volume > 0:
+        return float(_vwap_kernel(high, low, close, volume))
+    if total_volume <= 0:
+        return None
+    typical_price = (high + low + close) / 3.0
+    return float(np.dot(typical_price, volume) / total_volume)
+
+
 class ProductionDataProvider:
     """Production-safe data provider with no stub fallbacks."""
     
@@ -193,27 +260,14 @@ async def get_current_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
             logger.error(f"Failed to get current quote for {symbol}: {e}")
             return None
     
-    def calculate_true_vwap(self, intraday_bars: List[IntradayBar]) -> Optional[float]:
-        """Calculate true VWAP from intraday minute bars."""
-        if not intraday_bars:
+    @staticmethod
+    def calculate_true_vwap(intraday_bars: List[IntradayBar]) -> Optional[float]:
+        """Calculate true VWAP from intraday minute bars (list or BAR_DTYPE array)."""
+        if intraday_bars is None or len(intraday_bars) == 0:
             return None
         
         try:
-            total_pv = 0.0  # price * volume
-            total_volume = 0
-            
-            for bar in intraday_bars:
-                # Use typical price (H+L+C)/3 for each bar
-                typical_price = (bar.high + bar.low + bar.close) / 3.0
-                pv = typical_price * bar.volume
-                
-                total_pv += pv
-                total_volume += bar.volume
-            
-            if total_volume > 0:
-                return total_pv / total_volume
-            else:
-                return None
+            return vwap_from_arrays(*bars_to_arrays(intraday_bars))
                 
         except Exception as e:
             logger.error(f"Failed to calculate VWAP: {e}")
@@ -79,11 +79,21 @@ async def quotes(self, symbols: List[str]) -> Dict[str, Any]:
           - validation: validation summary
           - meta: timing + mode info
         """
+        simulate = self.config.get('auth.simulate', True)
+        ts = self._timestamp()
+        headers: Dict[str, str] = {}
+        if symbols and not simulate:
+            # Short-circuit before schema import/timing work when auth precondition unmet
+            try:
+                headers = await self._headers()
+            except MissingAccessTokenError as e:
+                # Deterministic structure for tests when auth precondition unmet
+                validation = {'is_valid': False, 'reason': str(e)}
+                return {'records': [], 'normalized': [], 'validation': validation, 'meta': {'mode': 'live_missing_token'}, 'ts': ts}
+
         from app.schemas.quotes import normalize_quote_data, validate_quote_data  # local import to avoid cycles
         start = asyncio.get_event_loop().time()
-        simulate = self.config.get('auth.simulate', True)
         records: List[Dict[str, Any]] = []
-        ts = self._timestamp()
         if not symbols:
             validation = validate_quote_data([])
             return {'records': [], 'normalized': [], 'validation': validation, 'meta': {'mode': 'simulate' if simulate else 'live_empty'}, 'ts': ts}
@@ -94,12 +104,6 @@ async def quotes(self, symbols: List[str]) -> Dict[str, Any]:
                 ask = 100.05
                 records.append({'symbol': sym.upper(), 'bid': bid, 'ask': ask, 'bid_size': 100, 'ask_size': 200, 'timestamp': ts})
         else:
-            try:
-                headers = await self._headers()
-            except MissingAccessTokenError as e:
-                # Deterministic structure for tests when auth precondition unmet
-                validation = {'is_valid': False, 'reason': str(e)}
-                return {'records': [], 'normalized': [], 'validation': validation, 'meta': {'mode': 'live_missing_token'}, 'ts': ts}
             await self._fetch_live_quotes(symbols, records, ts, headers)
         normalized = normalize_quote_data(records)
         validation = validate_quote_data(normalized)
@@ -0,0 +1,204 @@
+"""Column-wise helpers shared by the schema modules.
+
+Validators build one DataFrame from the input records and evaluate each rule
+as a boolean mask over all rows instead of looping record by record. The
+masks reproduce the per-record checks exactly: a key that is absent differs
+from one set to None, values are cast with Python's own ``float``/``int``
+where pandas cannot parse them, and ``messages`` renders the "Record {i}: ..."
+lines in the same order. In DataFrame input every column counts as a key and
+a NA cell counts as None, since a frame cannot tell them apart. DataFrame
+builders use ``astype_schema`` to cast all schema columns in a single pass.
+"""
+from __future__ import annotations
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# (row mask as Series or bool ndarray, message or per-row message Series)
+Check = Tuple[Union[pd.Series, np.ndarray], Union[str, pd.Series]]
+
+# Shared categorical dtype for low-cardinality text columns; categories are
+# inferred from the data
+CATEGORY = pd.CategoricalDtype()
+
+# infer_dtype kinds that cannot hold a str value
+_NUMERIC_KINDS = {'empty', 'boolean', 'integer', 'floating', 'mixed-integer-float', 'decimal'}
+
+
+Records = Union[List[Dict[str, Any]], pd.DataFrame]
+
+
+def frame_from_records(data: Records) -> pd.DataFrame:
+    """Build a DataFrame from records, or adapt a DataFrame given directly.
+
+    Record columns are kept as object so None stays distinct from NaN. In a
+    DataFrame, columns holding NA cells are recast to object with None in
+    their place. Record numbers in messages are positional, so any index is
+    fine.
+    """
+    if isinstance(data, pd.DataFrame):
+        na_columns = data.columns[data.isna().any().to_numpy()]
+        if len(na_columns) == 0:
+            return data
+        df = data.copy(deep=False)
+        for col in na_columns:
+            df[col] = data[col].astype(object).where(data[col].notna(), None)
+        return df
+    return pd.DataFrame(data, dtype=object)
+
+
+def column(df: pd.DataFrame, field: str) -> pd.Series:
+    """Return ``df[field]`` or an all-missing object column when absent."""
+    if field in df.columns:
+        return df[field]
+    return pd.Series(None, index=df.index, dtype=object)
+
+
+def _unset_rows(data: Records, df: pd.DataFrame, field: str) -> Tuple[np.ndarray, np.ndarray]:
+    """(absent, none) masks for ``field`` from one pass over its NaN rows.
+
+    An absent key reads back as NaN, never None, so only NaN rows need the
+    record itself.
+    """
+    absent = np.zeros(len(df), dtype=bool)
+    none = np.zeros(len(df), dtype=bool)
+    if field not in df.columns:
+        absent[:] = True
+        return absent, none
+    col = df[field]
+    values = col.to_numpy(dtype=object)
+    records = None if isinstance(data, pd.DataFrame) else data
+    for i in np.flatnonzero(col.isna().to_numpy()):
+        if values[i] is None:
+            none[i] = True
+        elif records is not None and field not in records[i]:
+            absent[i] = True
+    return absent, none
+
+
+def has_key(data: Records, df: pd.DataFrame, field: str) -> pd.Series:
+    """Mask of rows whose record has the key ``field``, whatever its value."""
+    absent, _ = _unset_rows(data, df, field)
+    return pd.Series(~absent, index=df.index)
+
+
+def has_value(data: Records, df: pd.DataFrame, field: str) -> pd.Series:
+    """Mask of rows whose record has the key ``field`` set to something other than None."""
+    absent, none = _unset_rows(data, df, field)
+    return pd.Series(~(absent | none), index=df.index)
+
+
+def missing(data: Records, df: pd.DataFrame, field: str) -> pd.Series:
+    """Mask of rows where ``field`` is absent, None or an empty string (NaN is a value)."""
+    col = column(df, field)
+    mask = ~has_value(data, df, field)
+    if col.dtype == object or isinstance(col.dtype, (pd.CategoricalDtype, pd.StringDtype)):
+        mask |= col.eq('').fillna(False).astype(bool)
+    return mask
+
+
+def cast(df: pd.DataFrame, field: str, to: Callable[[Any], Any], rows: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """Cast ``field`` with ``to`` (``float`` or ``int``) on the ``rows`` mask.
+
+    Returns ``(values, invalid)``: the cast values as float64, NaN outside
+    ``rows``, and a mask of rows where ``to`` raises. Values pandas parses
+    cleanly are converted in bulk; the rest (None, NaN, text, and for ``int``
+    infinities and any str) go through ``to`` itself.
+    """
+    col = column(df, field)
+    rows = rows.to_numpy(dtype=bool)
+    values = pd.to_numeric(col, errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    suspect = np.isnan(values)
+    raw = col.to_numpy(dtype=object)
+    if to is int:
+        values = np.trunc(values)
+        suspect |= np.isinf(values)
+        if pd.api.types.infer_dtype(col, skipna=True) not in _NUMERIC_KINDS:
+            suspect |= np.fromiter((isinstance(v, str) for v in raw), dtype=bool, count=len(raw))
+    invalid = np.zeros(len(values), dtype=bool)
+    for i in np.flatnonzero(suspect & rows):
+        try:
+            values[i] = to(raw[i])
+        except (TypeError, ValueError, OverflowError):
+            values[i] = np.nan
+            invalid[i] = True
+    values[~rows] = np.nan
+    return pd.Series(values, index=df.index), pd.Series(invalid, index=df.index)
+
+
+def not_instance(df: pd.DataFrame, field: str, types) -> pd.Series:
+    """Mask of rows whose ``field`` is not an instance of ``types``.
+
+    None and NaN are flagged too; combine with ``has_key``/``has_value`` to
+    restrict the check to the rows it applies to.
+    """
+    col = column(df, field)
+    types = types if isinstance(types, tuple) else (types,)
+    if datetime in types and pd.api.types.is_datetime64_any_dtype(col):
+        return pd.Series(False, index=df.index)
+    if str in types and pd.api.types.infer_dtype(col, skipna=False) == 'string':
+        return pd.Series(False, index=df.index)
+    values = col.to_numpy(dtype=object)
+    return pd.Series(
+        np.fromiter((not isinstance(v, types) for v in values), dtype=bool, count=len(values)),
+        index=df.index,
+    )
+
+
+def parse_datetimes(values: pd.Series, errors: str = 'raise', **kwargs: Any) -> pd.Series:
+    """``pd.to_datetime`` with the ISO8601 fast path and cache.
+
+    Input the ISO8601 parser rejects (or, with ``errors='coerce'``, turns
+    into NaT) is parsed again with per-element format inference, so non-ISO
+    timestamps still parse.
+    """
+    try:
+        parsed = pd.to_datetime(values, format='ISO8601', cache=True, errors=errors, **kwargs)
+    except (ValueError, TypeError):
+        return pd.to_datetime(values, format='mixed', cache=True, errors=errors, **kwargs)
+    if errors == 'coerce' and (parsed.isna() & values.notna()).any():
+        return pd.to_datetime(values, format='mixed', cache=True, errors=errors, **kwargs)
+    return parsed
+
+
+def astype_schema(df: pd.DataFrame, dtypes: Dict[str, Any]) -> pd.DataFrame:
+    """Cast the columns of ``df`` named in ``dtypes`` in one ``astype`` call.
+
+    If the bulk cast fails, columns are cast one by one and any column that
+    cannot be converted is left as-is.
+    """
+    dtypes = {col: dtype for col, dtype in dtypes.items() if col in df.columns}
+    try:
+        return df.astype(dtypes, copy=False)
+    except (ValueError, TypeError):
+        for col, dtype in dtypes.items():
+            try:
+                df[col] = df[col].astype(dtype)
+            except (ValueError, TypeError):
+                pass
+        return df
+
+
+def messages(checks: Sequence[Check]) -> List[str]:
+    """Render ``Record {i}: {message}`` lines for every flagged row.
+
+    Lines are ordered by record, then by the order of ``checks`` - the same
+    order a per-record loop evaluating the checks in sequence would produce.
+    A message may also be a Series of per-row strings.
+    """
+    if not checks:
+        return []
+    grid = np.vstack([
+        mask.to_numpy(dtype=bool, na_value=False) if isinstance(mask, pd.Series) else np.asarray(mask, dtype=bool)
+        for mask, _ in checks
+    ])
+    rows, cols = np.nonzero(grid.T)
+    lines = []
+    for i, c in zip(rows.tolist(), cols.tolist()):
+        message = checks[c][1]
+        if not isinstance(message, str):
+            message = message.iat[i]
+        lines.append(f"Record {i}: {message}")
+    return lines
@@ -6,6 +6,8 @@
 from dataclasses import dataclass
 from pandas._typing import DtypeArg
 
+from . import _vectorized as vec
+
 
 @dataclass
 class OHLCRecord:
@@ -48,23 +50,40 @@ class OHLCRecord:
     # timestamp handled via to_datetime(utc=True) above; avoid astype here
 }
 
+# Column -> dtype applied by create_ohlc_dataframe in a single astype;
+# symbol is stored as a categorical
+OHLC_FRAME_DTYPES: Dict[str, DtypeArg] = {
+    column: DTYPE_MAP[dtype] for column, dtype in OHLC_SCHEMA.items() if dtype in DTYPE_MAP
+}
+OHLC_FRAME_DTYPES['symbol'] = vec.CATEGORY
+
 # Required columns for OHLC data
 REQUIRED_OHLC_COLUMNS = [
     'symbol', 'timestamp', 'open', 'high', 'low', 'close', 'volume'
 ]
 
+# Row-wise OHLC consistency violations, evaluated over float price columns;
+# high/low are compared with max/min(open, close) as Python computes them,
+# which keep open unless close compares greater/smaller (so NaN never wins)
+OHLC_HIGH_BELOW_EXPR = "((close > open) & (high < close)) | (~(close > open) & (high < open))"
+OHLC_LOW_ABOVE_EXPR = "((close < open) & (low > close)) | (~(close < open) & (low > open))"
+OHLC_NON_POSITIVE_EXPR = "(open <= 0) | (high <= 0) | (low <= 0) | (close <= 0)"
+
+# Price columns (coerced to float)
+OHLC_PRICE_COLUMNS = ['open', 'high', 'low', 'close']
+
 # Optional columns
 OPTIONAL_OHLC_COLUMNS = [
     'interval', 'vwap', 'adj_close', 'dividend', 'split_coefficient'
 ]
 
 
-def validate_ohlc_data(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+def validate_ohlc_data(data: vec.Records) -> Dict[str, Any]:
     """
     Validate OHLC data structure and values
     
     Args:
-        data: List of OHLC records
+        data: List of OHLC records, or a DataFrame with one row per record
         
     Returns:
         Dict containing validation results
@@ -76,59 +95,53 @@ def validate_ohlc_data(data: List[Dict[str, Any]]) -> Dict[str, Any]:
         'record_count': len(data)
     }
     
-    if not data:
+    if len(data) == 0:
         validation_result['errors'].append("No data provided")
         validation_result['is_valid'] = False
         return validation_result
     
-    for i, record in enumerate(data):
-        # Check required fields
-        for field in REQUIRED_OHLC_COLUMNS:
-            if field not in record:
-                validation_result['errors'].append(f"Record {i}: Missing required field '{field}'")
-                validation_result['is_valid'] = False
-        
-        # Validate data types and values
-        if 'open' in record and 'high' in record and 'low' in record and 'close' in record:
-            try:
-                open_price = float(record['open'])
-                high_price = float(record['high'])
-                low_price = float(record['low'])
-                close_price = float(record['close'])
-                
-                # OHLC logic validation
-                if high_price < max(open_price, close_price):
-                    validation_result['errors'].append(f"Record {i}: High price lower than open/close")
-                    validation_result['is_valid'] = False
-
-                if low_price > min(open_price, close_price):
-                    validation_result['errors'].append(f"Record {i}: Low price higher than open/close")
-                    validation_result['is_valid'] = False
-                
-                if any(price <= 0 for price in [open_price, high_price, low_price, close_price]):
-                    validation_result['errors'].append(f"Record {i}: Prices must be positive")
-                    validation_result['is_valid'] = False
-                    
-            except (ValueError, TypeError):
-                validation_result['errors'].append(f"Record {i}: Invalid price data types")
-                validation_result['is_valid'] = False
-        
-        # Validate volume
-        if 'volume' in record:
-            try:
-                volume = int(record['volume'])
-                if volume < 0:
-                    validation_result['errors'].append(f"Record {i}: Negative volume")
-                    validation_result['is_valid'] = False
-            except (ValueError, TypeError):
-                validation_result['errors'].append(f"Record {i}: Invalid volume data type")
-                validation_result['is_valid'] = False
-        
-        # Validate timestamp
-        if 'timestamp' in record:
-            if not isinstance(record['timestamp'], (str, datetime)):
-                validation_result['errors'].append(f"Record {i}: Invalid timestamp format")
-                validation_result['is_valid'] = False
+    df = vec.frame_from_records(data)
+    has = {field: vec.has_key(data, df, field) for field in REQUIRED_OHLC_COLUMNS}
+    
+    # Check required fields
+    checks: List[vec.Check] = [
+        (~has[field], f"Missing required field '{field}'")
+        for field in REQUIRED_OHLC_COLUMNS
+    ]
+    
+    # Validate data types and values; prices are checked only when all four
+    # are present, and relationships only when all four cast to float
+    prices_present = has['open'] & has['high'] & has['low'] & has['close']
+    prices = {}
+    prices_bad = pd.Series(False, index=df.index)
+    for field in OHLC_PRICE_COLUMNS:
+        prices[field], bad = vec.cast(df, field, float, prices_present)
+        prices_bad |= bad
+    px = pd.DataFrame(prices, dtype='float64')
+    prices_ok = prices_present & ~prices_bad
+    # DataFrame.eval fuses each expression (numexpr when installed)
+    checks += [
+        (prices_ok & px.eval(OHLC_HIGH_BELOW_EXPR), "High price lower than open/close"),
+        (prices_ok & px.eval(OHLC_LOW_ABOVE_EXPR), "Low price higher than open/close"),
+        (prices_ok & px.eval(OHLC_NON_POSITIVE_EXPR), "Prices must be positive"),
+        (prices_bad, "Invalid price data types"),
+    ]
+    
+    # Validate volume
+    volume, volume_bad = vec.cast(df, 'volume', int, has['volume'])
+    checks += [
+        (volume.lt(0), "Negative volume"),
+        (volume_bad, "Invalid volume data type"),
+    ]
+    
+    # Validate timestamp
+    checks.append((
+        has['timestamp'] & vec.not_instance(df, 'timestamp', (str, datetime)),
+        "Invalid timestamp format",
+    ))
+    
+    validation_result['errors'] = vec.messages(checks)
+    validation_result['is_valid'] = not validation_result['errors']
     
     return validation_result
 
@@ -144,8 +157,18 @@ def normalize_ohlc_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         List of normalized OHLC records
     """
     normalized_data = []
+    if not data:
+        return normalized_data
+    
+    # Cast all prices column-wise instead of float() per value; tolist()
+    # hands back Python floats, with None where float() raised
+    df = vec.frame_from_records(data)
+    price_values = {}
+    for field in OHLC_PRICE_COLUMNS:
+        values, invalid = vec.cast(df, field, float, vec.has_key(data, df, field))
+        price_values[field] = values.astype(object).mask(invalid, None).tolist()
     
-    for record in data:
+    for i, record in enumerate(data):
         normalized_record = {}
         
         # Copy required fields
@@ -157,9 +180,11 @@ def normalize_ohlc_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
                         normalized_record[field] = record[field]
                     elif isinstance(record[field], datetime):
                         normalized_record[field] = record[field].isoformat()
-                elif field in ['open', 'high', 'low', 'close']:
-                    # Ensure prices are floats
-                    normalized_record[field] = float(record[field])
+                elif field in price_values:
+                    # Ensure prices are floats; a value that failed the bulk
+                    # cast raises from float() for this record, as before
+                    value = price_values[field][i]
+                    normalized_record[field] = float(record[field]) if value is None else value
                 elif field == 'volume':
                     # Ensure volume is int
                     normalized_record[field] = int(record[field])
@@ -196,36 +221,18 @@ def create_ohlc_dataframe(data: List[Dict[str, Any]]) -> pd.DataFrame:
     if not data:
         # Return empty DataFrame with schema
         df = pd.DataFrame(columns=list(OHLC_SCHEMA.keys()))
-        return df.astype(OHLC_SCHEMA)
+        return df.astype({**OHLC_SCHEMA, 'symbol': vec.CATEGORY})
     
     # Create DataFrame
-    df = pd.DataFrame(data)
+    df = pd.DataFrame.from_records(data)
     
     # Convert timestamp column
     if 'timestamp' in df.columns:
         # Use timezone-aware UTC timestamps for consistency
-        df['timestamp'] = pd.to_datetime(df['timestamp'], utc=True)
+        df['timestamp'] = vec.parse_datetimes(df['timestamp'], utc=True)
     
     # Apply schema
-    for column, dtype in OHLC_SCHEMA.items():
-        if column in df.columns:
-            try:
-                # Prefer pandas extension dtypes where applicable to satisfy type stubs
-                if dtype == 'string':
-                    df[column] = df[column].astype(pd.StringDtype())
-                elif column == 'timestamp':
-                    # Already converted via to_datetime with utc=True
-                    continue
-                else:
-                    mapped: Optional[DtypeArg] = DTYPE_MAP.get(dtype)
-                    if mapped is not None:
-                        df[column] = df[column].astype(mapped)
-                    else:
-                        # Fallback: leave as-is if not in map (shouldn't happen with current schema)
-                        continue
-            except (ValueError, TypeError):
-                # Handle conversion errors gracefully
-                pass
+    df = vec.astype_schema(df, OHLC_FRAME_DTYPES)
     
     return df
 
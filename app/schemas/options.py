@@ -2,10 +2,15 @@
 
 from typing import Dict, Any, List, Optional
 from datetime import datetime
+import logging
 import pandas as pd
 from dataclasses import dataclass
 from enum import Enum
 
+from . import _vectorized as vec
+
+logger = logging.getLogger(__name__)
+
 
 class OptionType(Enum):
     """Option type enumeration"""
@@ -65,6 +70,11 @@ class OptionRecord:
     'moneyness': 'string'
 }
 
+# Frame dtypes: low-cardinality text columns are stored as categoricals;
+# option_type has a fixed (lower-case) domain
+_OPTION_TYPE_DTYPE = pd.CategoricalDtype(categories=('call', 'put'), ordered=False)
+OPTIONS_FRAME_DTYPES = {**OPTIONS_SCHEMA, 'underlying_symbol': vec.CATEGORY, 'option_type': _OPTION_TYPE_DTYPE}
+
 # Required columns for options data
 REQUIRED_OPTIONS_COLUMNS = [
     'symbol', 'underlying_symbol', 'option_type', 'strike', 'expiration',
@@ -330,31 +340,44 @@ def create_options_dataframe(data: List[Dict[str, Any]]) -> pd.DataFrame:
     if not data:
         # Return empty DataFrame with schema
         df = pd.DataFrame(columns=list(OPTIONS_SCHEMA.keys()))
-        return df.astype({k: v for k, v in OPTIONS_SCHEMA.items() if k in df.columns})
+        return df.astype({k: v for k, v in OPTIONS_FRAME_DTYPES.items() if k in df.columns})
     
     # Create DataFrame
-    df = pd.DataFrame(data)
+    df = pd.DataFrame.from_records(data)
     
     # Convert timestamp columns
     for col in ['timestamp', 'expiration']:
         if col in df.columns:
-            df[col] = pd.to_datetime(df[col])
+            df[col] = vec.parse_datetimes(df[col])
     
-    # Apply schema
-    for column, dtype in OPTIONS_SCHEMA.items():
-        if column in df.columns:
-            try:
-                if dtype == 'string':
-                    df[column] = df[column].astype('string')
-                else:
-                    df[column] = df[column].astype(dtype)
-            except (ValueError, TypeError):
-                # Handle conversion errors gracefully
-                pass
+    # Apply schema; option_type is cast on its own so that values outside
+    # the fixed categories are not turned into NaN
+    df = vec.astype_schema(df, {k: v for k, v in OPTIONS_FRAME_DTYPES.items() if k != 'option_type'})
+    if 'option_type' in df.columns:
+        df['option_type'] = _option_type_column(df['option_type'])
     
     return df
 
 
+def _option_type_column(values: pd.Series) -> pd.Series:
+    """
+    Cast option types to the fixed call/put categorical
+    
+    Strings are lower-cased first, since validation is case-insensitive. If
+    any value is neither 'call' nor 'put', a warning is logged and the column
+    keeps categories inferred from the data instead.
+    """
+    lowered = values.replace({v: v.lower() for v in pd.unique(values.dropna()) if isinstance(v, str)})
+    unexpected = lowered.notna() & ~lowered.isin(_OPTION_TYPE_DTYPE.categories)
+    if unexpected.any():
+        logger.warning(
+            "Unexpected option_type values %s; keeping inferred categories",
+            sorted(map(str, pd.unique(lowered[unexpected])))
+        )
+        return lowered.astype(vec.CATEGORY)
+    return lowered.astype(_OPTION_TYPE_DTYPE)
+
+
 def calculate_options_metrics(df: pd.DataFrame) -> Dict[str, Any]:
     """
     Calculate metrics from options data
@@ -378,8 +401,9 @@ def calculate_options_metrics(df: pd.DataFrame) -> Dict[str, Any]:
         
         # Option type distribution
         if 'option_type' in df.columns:
-            type_counts = df['option_type'].value_counts().to_dict()
-            metrics['option_type_distribution'] = type_counts
+            # Categorical counts list every category; report only types seen
+            type_counts = df['option_type'].value_counts()
+            metrics['option_type_distribution'] = type_counts[type_counts > 0].to_dict()
         
         # Volume and open interest
         if 'volume' in df.columns:
@@ -6,9 +6,14 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+import numpy as np
 import pandas as pd
 
+from ..utils._njit import njit, prange, NUMBA_AVAILABLE
+from . import _polars_impl
+from . import _vectorized as vec
+
 @dataclass
 class QuoteRecord:
     symbol: str
@@ -27,49 +32,96 @@ class QuoteRecord:
     'timestamp': 'datetime64[ns]'
 }
 
+# Frame dtypes: low-cardinality text columns are stored as categoricals
+QUOTE_FRAME_DTYPES = {**QUOTE_SCHEMA, 'symbol': vec.CATEGORY}
+
 REQUIRED_QUOTE_FIELDS = ['symbol', 'bid', 'ask', 'timestamp']
 OPTIONAL_QUOTE_FIELDS = ['bid_size', 'ask_size']
 
-def validate_quote_data(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+# Range-check flag bits produced per row by _quote_range_flags
+_BID_NONPOSITIVE = 1
+_ASK_NONPOSITIVE = 2
+_SPREAD_INVERTED = 4
+_BID_SIZE_NEGATIVE = 8
+_ASK_SIZE_NEGATIVE = 16
+
+# Below this many rows thread start-up outweighs the parallel kernel
+NUMBA_MIN_RECORDS = 1000
+
+@njit(parallel=True, cache=True)
+def _quote_range_flags(bid, ask, bid_size, ask_size):
+    """Bit-packed range-check flags per row; NaN never sets a flag."""
+    n = bid.shape[0]
+    out = np.zeros(n, dtype=np.uint8)
+    for i in prange(n):
+        flags = 0
+        if bid[i] <= 0:
+            flags |= _BID_NONPOSITIVE
+        if ask[i] <= 0:
+            flags |= _ASK_NONPOSITIVE
+        if bid[i] > ask[i]:
+            flags |= _SPREAD_INVERTED
+        if bid_size[i] < 0:
+            flags |= _BID_SIZE_NEGATIVE
+        if ask_size[i] < 0:
+            flags |= _ASK_SIZE_NEGATIVE
+        out[i] = flags
+    return out
+
+def _range_masks(bid: pd.Series, ask: pd.Series, bid_size: pd.Series, ask_size: pd.Series) -> Tuple[Any, ...]:
+    """(bid<=0, ask<=0, bid>ask, bid_size<0, ask_size<0) masks for coerced columns."""
+    if NUMBA_AVAILABLE and len(bid) >= NUMBA_MIN_RECORDS:
+        arrays = [s.to_numpy(dtype=np.float64, na_value=np.nan) for s in (bid, ask, bid_size, ask_size)]
+        flags = _quote_range_flags(*arrays)
+        return tuple((flags & bit) != 0 for bit in (
+            _BID_NONPOSITIVE, _ASK_NONPOSITIVE, _SPREAD_INVERTED, _BID_SIZE_NEGATIVE, _ASK_SIZE_NEGATIVE))
+    return bid.le(0), ask.le(0), bid.gt(ask), bid_size.lt(0), ask_size.lt(0)
+
+def validate_quote_data(data: vec.Records) -> Dict[str, Any]:
     result = {
         'is_valid': True,
         'errors': [],
         'warnings': [],
         'record_count': len(data)
     }
-    if not data:
+    if len(data) == 0:
         result['errors'].append('No data provided')
         result['is_valid'] = False
         return result
-    for i, record in enumerate(data):
-        for field in REQUIRED_QUOTE_FIELDS:
-            if field not in record or record[field] in (None, ''):
-                result['errors'].append(f"Record {i}: Missing required field '{field}'")
-                result['is_valid'] = False
-        try:
-            if 'bid' in record and float(record['bid']) <= 0:
-                result['errors'].append(f"Record {i}: Bid must be positive")
-                result['is_valid'] = False
-            if 'ask' in record and float(record['ask']) <= 0:
-                result['errors'].append(f"Record {i}: Ask must be positive")
-                result['is_valid'] = False
-            if 'bid' in record and 'ask' in record and float(record['bid']) > float(record['ask']):
-                result['warnings'].append(f"Record {i}: Bid > Ask spread inversion")
-        except (TypeError, ValueError):
-            result['errors'].append(f"Record {i}: Non-numeric bid/ask")
-            result['is_valid'] = False
-        for size_field in ['bid_size', 'ask_size']:
-            if size_field in record and record[size_field] is not None:
-                try:
-                    sz = int(record[size_field])
-                    if sz < 0:
-                        result['warnings'].append(f"Record {i}: {size_field} negative")
-                except (TypeError, ValueError):
-                    result['warnings'].append(f"Record {i}: {size_field} not integer")
-        if 'timestamp' in record and record['timestamp'] not in (None, ''):
-            if not isinstance(record['timestamp'], (str, datetime)):
-                result['errors'].append(f"Record {i}: Invalid timestamp type")
-                result['is_valid'] = False
+    if not isinstance(data, pd.DataFrame) and _polars_impl.polars_enabled(len(data)):
+        screened = _polars_impl.validate_quote_data_pl(data)
+        if screened is not None:
+            return screened
+    df = vec.frame_from_records(data)
+    # bid and ask are cast in turn and the first failure skips the rest, so
+    # ask is only cast where bid succeeded; a NaN value fails no comparison
+    bid, bid_bad = vec.cast(df, 'bid', float, vec.has_key(data, df, 'bid'))
+    ask, ask_bad = vec.cast(df, 'ask', float, vec.has_key(data, df, 'ask') & ~bid_bad)
+    bid_size, bid_size_bad = vec.cast(df, 'bid_size', int, vec.has_value(data, df, 'bid_size'))
+    ask_size, ask_size_bad = vec.cast(df, 'ask_size', int, vec.has_value(data, df, 'ask_size'))
+    bid_le0, ask_le0, inverted, bid_size_neg, ask_size_neg = _range_masks(bid, ask, bid_size, ask_size)
+    missing = {field: vec.missing(data, df, field) for field in REQUIRED_QUOTE_FIELDS}
+    errors: List[vec.Check] = [
+        (missing[field], f"Missing required field '{field}'")
+        for field in REQUIRED_QUOTE_FIELDS
+    ]
+    errors += [
+        (bid_le0, "Bid must be positive"),
+        (ask_le0, "Ask must be positive"),
+        (bid_bad | ask_bad, "Non-numeric bid/ask"),
+        (~missing['timestamp'] & vec.not_instance(df, 'timestamp', (str, datetime)),
+         "Invalid timestamp type"),
+    ]
+    warnings: List[vec.Check] = [
+        (inverted, "Bid > Ask spread inversion"),
+        (bid_size_neg, "bid_size negative"),
+        (bid_size_bad, "bid_size not integer"),
+        (ask_size_neg, "ask_size negative"),
+        (ask_size_bad, "ask_size not integer"),
+    ]
+    result['errors'] = vec.messages(errors)
+    result['warnings'] = vec.messages(warnings)
+    result['is_valid'] = not result['errors']
     return result
 
 def normalize_quote_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -99,19 +151,14 @@ def normalize_quote_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 def create_quotes_dataframe(data: List[Dict[str, Any]]) -> pd.DataFrame:
     if not data:
         df = pd.DataFrame(columns=list(QUOTE_SCHEMA.keys()))
-        return df.astype(QUOTE_SCHEMA)
-    df = pd.DataFrame(data)
+        return df.astype(QUOTE_FRAME_DTYPES)
+    df = pd.DataFrame.from_records(data)
     if 'timestamp' in df.columns:
-        df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-    for col, dtype in QUOTE_SCHEMA.items():
-        target_dtype = 'string' if dtype == 'string' else dtype  # explicit mapping for type checkers
-        if col in df.columns:
-            try:
-                df[col] = df[col].astype(target_dtype)  # type: ignore[arg-type]
-            except Exception:
-                pass
-        else:
-            df[col] = pd.Series([None] * len(df), dtype=target_dtype)
+        df['timestamp'] = vec.parse_datetimes(df['timestamp'], errors='coerce')
+    df = vec.astype_schema(df, QUOTE_FRAME_DTYPES)
+    for col, dtype in QUOTE_FRAME_DTYPES.items():
+        if col not in df.columns:
+            df[col] = pd.Series([None] * len(df), dtype=dtype)
     return df
 
 def calculate_quote_metrics(df: pd.DataFrame) -> Dict[str, Any]:
@@ -6,6 +6,8 @@
 from dataclasses import dataclass
 from enum import Enum
 
+from . import _vectorized as vec
+
 
 class TradeSide(Enum):
     """Trade side enumeration"""
@@ -53,6 +55,9 @@ class TimeSalesRecord:
     'cumulative_volume': 'int64'
 }
 
+# Frame dtypes: low-cardinality text columns are stored as categoricals
+TIMESALES_FRAME_DTYPES = {**TIMESALES_SCHEMA, 'symbol': vec.CATEGORY, 'exchange': vec.CATEGORY}
+
 # Required columns for time and sales data
 REQUIRED_TIMESALES_COLUMNS = [
     'symbol', 'timestamp', 'price', 'size', 'exchange'
@@ -85,12 +90,12 @@ class TimeSalesRecord:
 }
 
 
-def validate_timesales_data(data: List[Dict[str, Any]]) -> Dict[str, Any]:
+def validate_timesales_data(data: vec.Records) -> Dict[str, Any]:
     """
     Validate time and sales data structure and values
     
     Args:
-        data: List of time and sales records
+        data: List of time and sales records, or a DataFrame with one row per record
         
     Returns:
         Dict containing validation results
@@ -102,73 +107,65 @@ def validate_timesales_data(data: List[Dict[str, Any]]) -> Dict[str, Any]:
         'record_count': len(data)
     }
     
-    if not data:
+    if len(data) == 0:
         validation_result['errors'].append("No data provided")
         validation_result['is_valid'] = False
         return validation_result
     
-    for i, record in enumerate(data):
-        # Check required fields
-        for field in REQUIRED_TIMESALES_COLUMNS:
-            if field not in record:
-                validation_result['errors'].append(f"Record {i}: Missing required field '{field}'")
-                validation_result['is_valid'] = False
-        
-        # Validate price
-        if 'price' in record:
-            try:
-                price = float(record['price'])
-                if price <= 0:
-                    validation_result['errors'].append(f"Record {i}: Price must be positive")
-                    validation_result['is_valid'] = False
-            except (ValueError, TypeError):
-                validation_result['errors'].append(f"Record {i}: Invalid price data type")
-                validation_result['is_valid'] = False
-        
-        # Validate size
-        if 'size' in record:
-            try:
-                size = int(record['size'])
-                if size <= 0:
-                    validation_result['errors'].append(f"Record {i}: Size must be positive")
-                    validation_result['is_valid'] = False
-                elif size > 10000000:  # 10M shares seems excessive for most trades
-                    validation_result['warnings'].append(f"Record {i}: Very large trade size")
-            except (ValueError, TypeError):
-                validation_result['errors'].append(f"Record {i}: Invalid size data type")
-                validation_result['is_valid'] = False
-        
-        # Validate timestamp
-        if 'timestamp' in record:
-            if not isinstance(record['timestamp'], (str, datetime)):
-                validation_result['errors'].append(f"Record {i}: Invalid timestamp format")
-                validation_result['is_valid'] = False
-        
-        # Validate exchange
-        if 'exchange' in record:
-            if not isinstance(record['exchange'], str):
-                validation_result['errors'].append(f"Record {i}: Exchange must be a string")
-                validation_result['is_valid'] = False
-        
-        # Validate side
-        if 'side' in record and record['side'] is not None:
-            valid_sides = [side.value for side in TradeSide]
-            if record['side'].lower() not in valid_sides:
-                validation_result['warnings'].append(f"Record {i}: Unknown trade side '{record['side']}'")
-        
-        # Validate conditions
-        if 'conditions' in record and record['conditions'] is not None:
-            if not isinstance(record['conditions'], list):
-                validation_result['warnings'].append(f"Record {i}: Conditions should be a list")
-        
-        # Validate sequence
-        if 'sequence' in record and record['sequence'] is not None:
-            try:
-                sequence = int(record['sequence'])
-                if sequence < 0:
-                    validation_result['warnings'].append(f"Record {i}: Negative sequence number")
-            except (ValueError, TypeError):
-                validation_result['warnings'].append(f"Record {i}: Invalid sequence data type")
+    df = vec.frame_from_records(data)
+    has = {field: vec.has_key(data, df, field) for field in REQUIRED_TIMESALES_COLUMNS}
+    
+    # Check required fields
+    errors: List[vec.Check] = [
+        (~has[field], f"Missing required field '{field}'")
+        for field in REQUIRED_TIMESALES_COLUMNS
+    ]
+    
+    # Validate price
+    price, price_bad = vec.cast(df, 'price', float, has['price'])
+    errors += [
+        (price.le(0), "Price must be positive"),
+        (price_bad, "Invalid price data type"),
+    ]
+    
+    # Validate size; 10M shares seems excessive for most trades
+    size, size_bad = vec.cast(df, 'size', int, has['size'])
+    errors += [
+        (size.le(0), "Size must be positive"),
+        (size_bad, "Invalid size data type"),
+    ]
+    warnings: List[vec.Check] = [(size.gt(10000000), "Very large trade size")]
+    
+    # Validate timestamp and exchange
+    errors += [
+        (has['timestamp'] & vec.not_instance(df, 'timestamp', (str, datetime)), "Invalid timestamp format"),
+        (vec.has_key(data, df, 'exchange') & vec.not_instance(df, 'exchange', str), "Exchange must be a string"),
+    ]
+    
+    # Validate side
+    side = vec.column(df, 'side')
+    valid_sides = [s.value for s in TradeSide]
+    warnings.append((
+        vec.has_value(data, df, 'side') & ~side.astype(str).str.lower().isin(valid_sides),
+        "Unknown trade side '" + side.astype(str) + "'",
+    ))
+    
+    # Validate conditions
+    warnings.append((
+        vec.has_value(data, df, 'conditions') & vec.not_instance(df, 'conditions', list),
+        "Conditions should be a list",
+    ))
+    
+    # Validate sequence
+    sequence, sequence_bad = vec.cast(df, 'sequence', int, vec.has_value(data, df, 'sequence'))
+    warnings += [
+        (sequence.lt(0), "Negative sequence number"),
+        (sequence_bad, "Invalid sequence data type"),
+    ]
+    
+    validation_result['errors'] = vec.messages(errors)
+    validation_result['warnings'] = vec.messages(warnings)
+    validation_result['is_valid'] = not validation_result['errors']
     
     return validation_result
 
@@ -360,26 +357,17 @@ def create_timesales_dataframe(data: List[Dict[str, Any]]) -> pd.DataFrame:
     if not data:
         # Return empty DataFrame with schema
         df = pd.DataFrame(columns=list(TIMESALES_SCHEMA.keys()))
-        return df.astype({k: v for k, v in TIMESALES_SCHEMA.items() if k in df.columns})
+        return df.astype({k: v for k, v in TIMESALES_FRAME_DTYPES.items() if k in df.columns})
     
     # Create DataFrame
-    df = pd.DataFrame(data)
+    df = pd.DataFrame.from_records(data)
     
     # Convert timestamp column
     if 'timestamp' in df.columns:
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-    
-    # Apply schema
-    for column, dtype in TIMESALES_SCHEMA.items():
-        if column in df.columns:
-            try:
-                if dtype == 'string':
-                    df[column] = df[column].astype('string')
-                elif dtype != 'object':  # Skip object columns (like conditions list)
-                    df[column] = df[column].astype(dtype)
-            except (ValueError, TypeError):
-                # Handle conversion errors gracefully
-                pass
+        df['timestamp'] = vec.parse_datetimes(df['timestamp'])
+    
+    # Apply schema; object columns (like the conditions list) are left as-is
+    df = vec.astype_schema(df, {k: v for k, v in TIMESALES_FRAME_DTYPES.items() if v != 'object'})
     
     return df
 
@@ -6,27 +6,62 @@
 """
 from __future__ import annotations
 from typing import Tuple, Optional
+import numpy as np
 import pandas as pd
 
+from ..utils._njit import njit, NUMBA_AVAILABLE
+
 LabelledDF = pd.DataFrame
 
+# Tick codes -1/0/+1 index into this after a +1 shift
+_TICK_LABELS = np.array(["bid", "mid", "ask"], dtype=object)
+
+
+@njit(cache=True)
+def _tick_label_loop(prices):
+    """Single pass tick rule: +1 uptick (ask), -1 downtick (bid), 0 otherwise (mid)."""
+    n = prices.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    for i in range(1, n):
+        if prices[i] > prices[i - 1]:
+            out[i] = 1
+        elif prices[i] < prices[i - 1]:
+            out[i] = -1
+    return out
+
+
+def _tick_codes(prices: np.ndarray) -> np.ndarray:
+    """Tick rule codes per trade; compiled loop with numba, else NumPy."""
+    if NUMBA_AVAILABLE:
+        return _tick_label_loop(prices)
+    codes = np.zeros(prices.shape[0], dtype=np.int8)
+    if prices.shape[0] > 1:
+        diff = prices[1:] - prices[:-1]
+        codes[1:] = (diff > 0).astype(np.int8) - (diff < 0).astype(np.int8)
+    return codes
+
+
+def _utc_times(values: pd.Series) -> pd.Series:
+    """Parse timestamps to datetime64[ns, UTC] once; already-parsed columns pass through."""
+    if isinstance(values.dtype, pd.DatetimeTZDtype) and str(values.dt.tz) == "UTC":
+        return values
+    return pd.to_datetime(values, utc=True, cache=True)
+
+
+def _sorted_by_time(df: pd.DataFrame) -> pd.DataFrame:
+    """Stable sort on dt_utc (int64 under the hood), skipped when already ordered."""
+    if df["dt_utc"].is_monotonic_increasing:
+        return df
+    return df.sort_values("dt_utc", kind="stable")
+
 
 def _tick_labels(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame({"label": [], "confidence": []})
-    df = df.sort_values("dt_utc").copy()
-    prev_price = df["price"].shift(1)
-    def decide(idx: int, price: float) -> str:
-        pv = prev_price.iloc[idx]
-        if pd.isna(pv):
-            return "mid"
-        if price > pv:
-            return "ask"
-        if price < pv:
-            return "bid"
-        return "mid"
-    labels = [decide(i, p) for i, p in enumerate(df["price"])]
-    return pd.DataFrame({"label": labels, "confidence": ["tick"] * len(labels)}, index=df.index)
+    df = _sorted_by_time(df)
+    prices = pd.to_numeric(df["price"], errors="coerce").to_numpy(dtype=np.float64)
+    labels = _TICK_LABELS[_tick_codes(prices) + 1]
+    return pd.DataFrame({"label": labels, "confidence": "tick"}, index=df.index)
 
 
 def classify_trades(trades: pd.DataFrame, quotes: Optional[pd.DataFrame] = None, *, nbbo_window_ms: int = 1000, price_epsilon: float = 1e-6) -> LabelledDF:
@@ -38,27 +73,27 @@ def classify_trades(trades: pd.DataFrame, quotes: Optional[pd.DataFrame] = None,
     if trades is None or trades.empty:
         return trades.copy() if trades is not None else pd.DataFrame()
     t = trades.copy()
-    t["dt_utc"] = pd.to_datetime(t["dt_utc"], utc=True)
+    t["dt_utc"] = _utc_times(t["dt_utc"])
     if quotes is None or quotes.empty:
         t[["label", "confidence"]] = _tick_labels(t)
         return t
     q = quotes.copy()
-    q["dt_utc"] = pd.to_datetime(q["dt_utc"], utc=True)
-    q = q.sort_values("dt_utc")[["dt_utc", "bid", "ask"]]
-    t = t.sort_values("dt_utc")
+    q["dt_utc"] = _utc_times(q["dt_utc"])
+    q = _sorted_by_time(q[["dt_utc", "bid", "ask"]])
+    t = _sorted_by_time(t)
     merged = pd.merge_asof(t, q, on="dt_utc", direction="nearest", tolerance=pd.Timedelta(milliseconds=nbbo_window_ms))
-    def decide(row) -> Optional[str]:
-        b, a, p = row.get("bid"), row.get("ask"), row["price"]
-        if pd.isna(b) or pd.isna(a):
-            return None
-        if p >= a - price_epsilon:
-            return "ask"
-        if p <= b + price_epsilon:
-            return "bid"
-        return "mid"
-    # apply returns scalar per row here (label string or None)
-    merged["label"] = merged.apply(decide, axis=1)  # type: ignore[arg-type]
-    merged["confidence"] = merged["label"].apply(lambda v: "nbbo" if v is not None else None)
+    price = merged["price"].to_numpy(dtype=np.float64)
+    bid = merged["bid"].to_numpy(dtype=np.float64)
+    ask = merged["ask"].to_numpy(dtype=np.float64)
+    has_nbbo = ~(np.isnan(bid) | np.isnan(ask))
+    # First matching condition wins; trades without a quote get None for the tick fallback
+    labels = np.select(
+        [~has_nbbo, price >= ask - price_epsilon, price <= bid + price_epsilon],
+        [None, "ask", "bid"],
+        default="mid",
+    )
+    merged["label"] = labels
+    merged["confidence"] = np.where(has_nbbo, "nbbo", None)
     missing_mask = merged["label"].isna()
     if missing_mask.any():
         tick_fallback = _tick_labels(merged.loc[missing_mask, ["dt_utc", "price", "size"]])
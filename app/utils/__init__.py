@@ -8,6 +8,7 @@
     validate_price,
     validate_volume,
     validate_timestamp,
+    validate_timestamps_bulk,
     validate_exchange,
     validate_option_symbol,
     validate_strike_price,
@@ -149,6 +150,7 @@
     'validate_price',
     'validate_volume',
     'validate_timestamp',
+    'validate_timestamps_bulk',
     
     # Types
     'DataRecord',
@@ -0,0 +1,25 @@
+"""Optional numba JIT support.
+
+Exposes ``njit`` and ``prange`` that resolve to numba when it is installed and
+to no-op fallbacks otherwise, so kernels can be written once and still run
+(as plain Python/NumPy) in environments without numba.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is an optional dependency
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and parametrized use)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+
+__all__ = ["njit", "prange", "NUMBA_AVAILABLE"]
@@ -1,12 +1,41 @@
 """Data validation utilities for trade analysis"""
 
 from typing import Any, Dict, List, Optional, Union, Callable
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Patterns and lookup sets are built once at import; the scalar validators
+# below are called in tight loops.
+# Basic symbol pattern: 1-6 uppercase letters, optionally followed by dot and suffix
+_SYMBOL_RE = re.compile(r'^[A-Z]{1,6}(\.[A-Z]{1,3})?$')
+# OCC format: ROOT + YYMMDD + C/P + 00000000 (strike * 1000)
+# Example: AAPL240119C00150000
+_OPTION_RE = re.compile(r'^[A-Z]{1,6}\d{6}[CP]\d{8}$')
+# Every form fromisoformat accepts starts with the four-digit year, so
+# strings without one are rejected without going through its exception path
+_ISO_YEAR_RE = re.compile(r'^\d{4}')
+# Layout accepted by the pyarrow bulk timestamp path (strict, zero-padded)
+_ISO_BULK_PATTERN = r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:[0-5]\dZ?$'
+# Inclusive (low, high) bounds per Greek
+_GREEK_BOUNDS = {
+    'delta': (-1.0, 1.0),
+    'gamma': (0.0, float('inf')),     # 0 to positive
+    'theta': (-100.0, 100.0),         # typically negative for long positions
+    'vega': (0.0, float('inf')),      # 0 to positive
+    'rho': (-100.0, 100.0),           # can be positive or negative
+}
+_EXCHANGE_SET = frozenset({
+    'NYSE', 'NASDAQ', 'ARCA', 'BATS', 'IEX', 'CBOE',
+    'PSX', 'BX', 'BYX', 'EDGA', 'EDGX', 'CHX', 'NSX'
+})
+_COND_SET = frozenset({
+    'R', 'O', 'C', 'L', 'T', 'B', 'I', 'X', 'Z', 'P',
+    'Q', 'W', 'N', 'M', 'F', 'U', 'H', 'K', 'Y', 'V'
+})
+
 
 class ValidationError(Exception):
     """Custom validation error"""
@@ -64,9 +93,7 @@ def validate_symbol(symbol: str) -> bool:
     # Reject empty and lowercase originals (tests expect 'lower' invalid)
     if symbol == '' or symbol != symbol.upper():
         return False
-    # Basic symbol pattern: 1-6 uppercase letters, optionally followed by dot and suffix
-    pattern = r'^[A-Z]{1,6}(\.[A-Z]{1,3})?$'
-    return bool(re.match(pattern, symbol))
+    return _SYMBOL_RE.match(symbol) is not None
 
 
 def validate_price(price: Union[int, float], min_price: float = 0.0, max_price: float = 1000000.0) -> bool:
@@ -125,11 +152,13 @@ def validate_timestamp(timestamp: Union[str, datetime],
         True if valid timestamp
     """
     try:
-        if isinstance(timestamp, str):
+        if isinstance(timestamp, datetime):
+            dt = timestamp
+        elif isinstance(timestamp, str):
+            if _ISO_YEAR_RE.match(timestamp) is None:
+                return False
             # Try to parse ISO format
             dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-        elif isinstance(timestamp, datetime):
-            dt = timestamp
         else:
             return False
         
@@ -151,6 +180,57 @@ def validate_timestamp(timestamp: Union[str, datetime],
         return False
 
 
+def validate_timestamps_bulk(timestamps: List[Any],
+                             allow_future: bool = False,
+                             max_age_days: Optional[int] = None) -> List[bool]:
+    """
+    Validate many timestamps at once
+    
+    Strings in the common ``YYYY-MM-DDTHH:MM:SS[Z]`` layout are parsed in one
+    pass with pyarrow compute kernels. Anything the bulk pass does not accept
+    (datetimes, other ISO layouts, invalid values) is re-checked with
+    validate_timestamp, so results match calling it item by item.
+    
+    Args:
+        timestamps: Timestamps to validate
+        allow_future: Whether to allow future timestamps
+        max_age_days: Maximum age in days
+        
+    Returns:
+        List of validation results, one per timestamp
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        return [validate_timestamp(ts, allow_future, max_age_days) for ts in timestamps]
+    
+    arr = pa.array([ts if isinstance(ts, str) else None for ts in timestamps], type=pa.string())
+    shaped = pc.match_substring_regex(arr, _ISO_BULK_PATTERN)
+    is_utc = pc.ends_with(arr, 'Z')
+    parsed = pc.strptime(pc.utf8_slice_codeunits(arr, 0, 19), format='%Y-%m-%dT%H:%M:%S',
+                         unit='ns', error_is_null=True)
+    ok = pc.and_kleene(shaped, pc.is_valid(parsed))
+    
+    # Naive strings compare against local time, 'Z' strings against UTC
+    now_local = datetime.now()
+    now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+    
+    def reference(local: datetime, utc: datetime):
+        return pc.if_else(is_utc, pa.scalar(utc, pa.timestamp('ns')), pa.scalar(local, pa.timestamp('ns')))
+    
+    if not allow_future:
+        ok = pc.and_kleene(ok, pc.less_equal(parsed, reference(now_local, now_utc)))
+    if max_age_days is not None:
+        # (now - dt).days > max_age_days  <=>  dt <= now - (max_age_days + 1) days
+        window = timedelta(days=max_age_days + 1)
+        ok = pc.and_kleene(ok, pc.greater(parsed, reference(now_local - window, now_utc - window)))
+    
+    fast = pc.fill_null(ok, False).to_pylist()
+    return [True if passed else validate_timestamp(ts, allow_future, max_age_days)
+            for passed, ts in zip(fast, timestamps)]
+
+
 def validate_exchange(exchange: str) -> bool:
     """
     Validate exchange code
@@ -161,15 +241,7 @@ def validate_exchange(exchange: str) -> bool:
     Returns:
         True if valid exchange
     """
-    if not isinstance(exchange, str):
-        return False
-    
-    valid_exchanges = {
-        'NYSE', 'NASDAQ', 'ARCA', 'BATS', 'IEX', 'CBOE',
-        'PSX', 'BX', 'BYX', 'EDGA', 'EDGX', 'CHX', 'NSX'
-    }
-    
-    return exchange.upper() in valid_exchanges
+    return isinstance(exchange, str) and exchange.upper() in _EXCHANGE_SET
 
 
 def validate_option_symbol(symbol: str) -> bool:
@@ -185,10 +257,7 @@ def validate_option_symbol(symbol: str) -> bool:
     if not isinstance(symbol, str):
         return False
     
-    # OCC format: ROOT + YYMMDD + C/P + 00000000 (strike * 1000)
-    # Example: AAPL240119C00150000
-    pattern = r'^[A-Z]{1,6}\d{6}[CP]\d{8}$'
-    return bool(re.match(pattern, symbol.upper()))
+    return _OPTION_RE.match(symbol.upper()) is not None
 
 
 def validate_strike_price(strike: Union[int, float], 
@@ -253,45 +322,13 @@ def validate_greeks(greeks: Dict[str, Union[int, float]]) -> Dict[str, bool]:
     """
     results = {}
     
-    # Delta: -1 to 1
-    if 'delta' in greeks:
-        try:
-            delta = float(greeks['delta'])
-            results['delta'] = -1 <= delta <= 1
-        except (ValueError, TypeError):
-            results['delta'] = False
-    
-    # Gamma: 0 to positive
-    if 'gamma' in greeks:
-        try:
-            gamma = float(greeks['gamma'])
-            results['gamma'] = gamma >= 0
-        except (ValueError, TypeError):
-            results['gamma'] = False
-    
-    # Theta: typically negative for long positions
-    if 'theta' in greeks:
-        try:
-            theta = float(greeks['theta'])
-            results['theta'] = -100 <= theta <= 100  # Reasonable range
-        except (ValueError, TypeError):
-            results['theta'] = False
-    
-    # Vega: 0 to positive
-    if 'vega' in greeks:
-        try:
-            vega = float(greeks['vega'])
-            results['vega'] = vega >= 0
-        except (ValueError, TypeError):
-            results['vega'] = False
-    
-    # Rho: can be positive or negative
-    if 'rho' in greeks:
-        try:
-            rho = float(greeks['rho'])
-            results['rho'] = -100 <= rho <= 100  # Reasonable range
-        except (ValueError, TypeError):
-            results['rho'] = False
+    for greek, (lo, hi) in _GREEK_BOUNDS.items():
+        if greek in greeks:
+            try:
+                value = float(greeks[greek])
+                results[greek] = lo <= value <= hi
+            except (ValueError, TypeError):
+                results[greek] = False
     
     return results
 
@@ -388,18 +425,23 @@ def validate_trade_conditions(conditions: List[str]) -> List[str]:
     Returns:
         List of invalid condition codes
     """
-    valid_conditions = {
-        'R', 'O', 'C', 'L', 'T', 'B', 'I', 'X', 'Z', 'P',
-        'Q', 'W', 'N', 'M', 'F', 'U', 'H', 'K', 'Y', 'V'
-    }
-    
-    invalid_conditions = []
-    
-    for condition in conditions:
-        if condition not in valid_conditions:
-            invalid_conditions.append(condition)
-    
-    return invalid_conditions
+    return [condition for condition in conditions if condition not in _COND_SET]
+
+
+def _safe_check(validator: Callable[[Any], Any]) -> Callable[[Any], bool]:
+    """Wrap a field validator so exceptions count as failures"""
+    def check(value: Any) -> bool:
+        try:
+            return bool(validator(value))
+        except Exception:
+            return False
+    return check
+
+
+# Batch counterparts used by SchemaValidator when screening many records
+_BULK_VALIDATORS: Dict[Callable[[Any], bool], Callable[[List[Any]], List[bool]]] = {
+    validate_timestamp: validate_timestamps_bulk,
+}
 
 
 class SchemaValidator:
@@ -413,6 +455,29 @@ def __init__(self, schema: Dict[str, Dict[str, Any]]):
             schema: Field validation schema
         """
         self.schema = schema
+        
+        # Resolve each field's config once so validate_record only walks
+        # tuples: (name, required, type, type_name, validator, min, max)
+        fields = []
+        for field_name, field_config in schema.items():
+            expected_type = field_config.get('type') or None
+            if isinstance(expected_type, tuple):
+                type_name = ' or '.join(t.__name__ for t in expected_type)
+            else:
+                type_name = getattr(expected_type, '__name__', '')
+            validator = field_config.get('validator')
+            fields.append((
+                field_name,
+                bool(field_config.get('required', False)),
+                expected_type,
+                type_name,
+                validator if callable(validator) else None,
+                field_config.get('min'),
+                field_config.get('max'),
+            ))
+        self._fields = tuple(fields)
+        self._field_index = {spec[0]: spec for spec in self._fields}
+        self._required = tuple(spec[0] for spec in self._fields if spec[1])
     
     def validate_record(self, record: Dict[str, Any]) -> ValidationResult:
         """
@@ -427,45 +492,109 @@ def validate_record(self, record: Dict[str, Any]) -> ValidationResult:
         result = ValidationResult()
         
         # Check required fields
-        for field_name, field_config in self.schema.items():
-            if field_config.get('required', False) and field_name not in record:
+        for field_name in self._required:
+            if field_name not in record:
                 result.add_error(f"Missing required field: {field_name}", field_name)
         
         # Validate present fields
+        field_index = self._field_index
         for field_name, value in record.items():
-            if field_name in self.schema:
-                field_config = self.schema[field_name]
-                
-                # Type validation
-                expected_type = field_config.get('type')
-                if expected_type and not isinstance(value, expected_type):
-                    result.add_error(f"Invalid type for {field_name}: expected {expected_type.__name__}", field_name)
-                    continue
-                
-                # Custom validator
-                validator = field_config.get('validator')
-                if validator and callable(validator):
-                    try:
-                        if not validator(value):
-                            result.add_error(f"Validation failed for {field_name}", field_name)
-                    except Exception as e:
-                        result.add_error(f"Validator error for {field_name}: {str(e)}", field_name)
-                
-                # Range validation
-                min_val = field_config.get('min')
-                max_val = field_config.get('max')
-                if min_val is not None or max_val is not None:
-                    try:
-                        num_val = float(value)
-                        if min_val is not None and num_val < min_val:
-                            result.add_error(f"{field_name} below minimum: {num_val} < {min_val}", field_name)
-                        if max_val is not None and num_val > max_val:
-                            result.add_error(f"{field_name} above maximum: {num_val} > {max_val}", field_name)
-                    except (ValueError, TypeError):
-                        pass  # Type error already reported
+            spec = field_index.get(field_name)
+            if spec is None:
+                continue
+            _, _, expected_type, type_name, validator, min_val, max_val = spec
+            
+            # Type validation
+            if expected_type is not None and not isinstance(value, expected_type):
+                result.add_error(f"Invalid type for {field_name}: expected {type_name}", field_name)
+                continue
+            
+            # Custom validator
+            if validator is not None:
+                try:
+                    if not validator(value):
+                        result.add_error(f"Validation failed for {field_name}", field_name)
+                except Exception as e:
+                    result.add_error(f"Validator error for {field_name}: {str(e)}", field_name)
+            
+            # Range validation
+            if min_val is not None or max_val is not None:
+                try:
+                    num_val = float(value)
+                    if min_val is not None and num_val < min_val:
+                        result.add_error(f"{field_name} below minimum: {num_val} < {min_val}", field_name)
+                    if max_val is not None and num_val > max_val:
+                        result.add_error(f"{field_name} above maximum: {num_val} > {max_val}", field_name)
+                except (ValueError, TypeError):
+                    pass  # Type error already reported
         
         return result
     
+    def _flag_records(self, records: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Screen a batch column by column for records that may be invalid
+        
+        A record is flagged when any schema field is missing/null or its value
+        fails the type, validator or range checks. Flagging is conservative:
+        unflagged records are guaranteed to pass validate_record.
+        
+        Args:
+            records: List of records to screen
+            
+        Returns:
+            List with one flag per record
+        """
+        if not records:
+            return []
+        
+        # Deferred so the scalar validators stay importable without pandas;
+        # without it every record takes the per-record path
+        try:
+            import numpy as np
+            import pandas as pd
+        except ImportError:
+            return [True] * len(records)
+        
+        # dtype=object keeps the original Python values (no int -> float
+        # upcasting) so isinstance checks match validate_record; absent keys
+        # become NaN
+        df = pd.DataFrame(records, dtype=object)
+        err = np.zeros((len(df), len(self._fields)), dtype=bool)
+        
+        for j, (field_name, required, expected_type, _, validator, min_val, max_val) in enumerate(self._fields):
+            if field_name not in df.columns:
+                err[:, j] = required
+                continue
+            
+            col = df[field_name]
+            present = col.notna().to_numpy()
+            bad = ~present
+            
+            if expected_type is not None:
+                type_ok = col.map(lambda v: isinstance(v, expected_type)).to_numpy(dtype=bool)
+                bad |= present & ~type_ok
+                present &= type_ok
+            
+            values = col[present]
+            if validator is not None:
+                bulk = _BULK_VALIDATORS.get(validator)
+                if bulk is not None:
+                    passed = np.asarray(bulk(values.tolist()), dtype=bool)
+                else:
+                    passed = values.map(_safe_check(validator)).to_numpy(dtype=bool)
+                bad[present] |= ~passed
+            
+            if min_val is not None or max_val is not None:
+                num = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+                if min_val is not None:
+                    bad[present] |= num < min_val
+                if max_val is not None:
+                    bad[present] |= num > max_val
+            
+            err[:, j] = bad
+        
+        return err.any(axis=1).tolist()
+    
     def validate_batch(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Validate a batch of records
@@ -485,7 +614,15 @@ def validate_batch(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
             'record_results': []
         }
         
+        # Column-wise screen; only flagged records go through validate_record
+        # for their detailed messages, the rest are known to be valid.
+        flagged = self._flag_records(records)
         for i, record in enumerate(records):
+            if not flagged[i]:
+                batch_result['valid_records'] += 1
+                batch_result['record_results'].append(ValidationResult().to_dict())
+                continue
+            
             record_result = self.validate_record(record)
             
             if record_result.is_valid:
@@ -546,7 +683,7 @@ def exact_match(redirect: str, registered: List[str]) -> bool:  # noqa: D401
     'timestamp': {
         'type': str,
         'required': True,
-        'validator': lambda x: validate_timestamp(x)
+        'validator': validate_timestamp
     }
 }
 
@@ -609,7 +746,7 @@ def exact_match(redirect: str, registered: List[str]) -> bool:  # noqa: D401
     'timestamp': {
         'type': str,
         'required': True,
-        'validator': lambda x: validate_timestamp(x)
+        'validator': validate_timestamp
     },
     'exchange': {
         'type': str,
@@ -1,5 +1,6 @@
 """Data writers for parquet files with metadata and idempotency"""
 
+import asyncio
 import logging
 import os
 import json
@@ -7,12 +8,19 @@
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
+import aiofiles
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 
 logger = logging.getLogger(__name__)
 
+# Algorithm behind metadata 'content_hash' values, stored per file entry as
+# 'hash_algo'. Entries written before it was recorded have no 'hash_algo' and
+# hold a sha256 of the CSV rendering; they are never compared with new hashes.
+CONTENT_HASH_ALGO = 'sha256-hash_pandas_object-v2'
+LEGACY_CONTENT_HASH_ALGO = 'sha256-csv-v1'
+
 
 class ParquetWriter:
     """Handles writing data to parquet files with metadata and idempotency"""
@@ -25,6 +33,26 @@ def __init__(self, base_path: str = "data"):
         self.data_types = ['quotes', 'historical', 'options', 'timesales']
         for data_type in self.data_types:
             (self.base_path / data_type).mkdir(exist_ok=True)
+        
+        # Serializes read-modify-write of each data type's metadata.json
+        self._metadata_locks: Dict[str, asyncio.Lock] = {}
+    
+    def _metadata_lock(self, data_type: str) -> asyncio.Lock:
+        """Get the lock guarding a data type's metadata file"""
+        lock = self._metadata_locks.get(data_type)
+        if lock is None:
+            lock = self._metadata_locks[data_type] = asyncio.Lock()
+        return lock
+    
+    async def _load_metadata(self, metadata_file: Path) -> Dict[str, Any]:
+        """Read a metadata file without blocking the event loop"""
+        async with aiofiles.open(metadata_file, 'r') as f:
+            return json.loads(await f.read())
+    
+    async def _save_metadata(self, metadata_file: Path, metadata: Dict[str, Any]) -> None:
+        """Write a metadata file without blocking the event loop"""
+        async with aiofiles.open(metadata_file, 'w') as f:
+            await f.write(json.dumps(metadata, indent=2))
     
     async def write_data(self, 
                         data: Union[List[Dict[str, Any]], pd.DataFrame],
@@ -113,9 +141,17 @@ async def write_data(self,
     
     def _generate_content_hash(self, df: pd.DataFrame) -> str:
         """Generate hash of DataFrame content for idempotency"""
-        # Convert DataFrame to string representation and hash it
-        content_str = df.to_csv(index=False).encode('utf-8')
-        return hashlib.sha256(content_str).hexdigest()[:16]
+        hasher = hashlib.sha256()
+        # Column names and dtypes are part of the content; row values are
+        # hashed column-wise by pandas instead of rendering the frame to text
+        hasher.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode('utf-8'))
+        try:
+            row_hashes = pd.util.hash_pandas_object(df, index=False)
+            hasher.update(row_hashes.to_numpy().tobytes())
+        except TypeError:
+            # Unhashable cell values (e.g. lists): fall back to a text rendering
+            hasher.update(df.to_csv(index=False).encode('utf-8'))
+        return hasher.hexdigest()[:16]
     
     async def _is_duplicate_data(self, data_type: str, symbol: str, content_hash: str) -> bool:
         """Check if data with this hash has already been written"""
@@ -125,12 +161,13 @@ async def _is_duplicate_data(self, data_type: str, symbol: str, content_hash: st
             return False
         
         try:
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+            metadata = await self._load_metadata(metadata_file)
             
             # Check if this hash exists in any file
             for file_info in metadata.get('files', []):
-                if file_info.get('symbol') == symbol and file_info.get('content_hash') == content_hash:
+                if (file_info.get('symbol') == symbol
+                        and file_info.get('hash_algo', LEGACY_CONTENT_HASH_ALGO) == CONTENT_HASH_ALGO
+                        and file_info.get('content_hash') == content_hash):
                     return True
             
             return False
@@ -219,44 +256,44 @@ async def _update_metadata_file(self,
         try:
             metadata_file = self.base_path / data_type / "metadata.json"
             
-            # Load existing metadata or create new
-            if metadata_file.exists():
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-            else:
-                metadata = {
-                    'data_type': data_type,
-                    'created_at': timestamp.isoformat(),
-                    'schema_version': '1.0',
-                    'files': []
+            async with self._metadata_lock(data_type):
+                # Load existing metadata or create new
+                if metadata_file.exists():
+                    metadata = await self._load_metadata(metadata_file)
+                else:
+                    metadata = {
+                        'data_type': data_type,
+                        'created_at': timestamp.isoformat(),
+                        'schema_version': '1.0',
+                        'files': []
+                    }
+                
+                # Add new file information
+                file_metadata = {
+                    'symbol': symbol,
+                    'file_path': file_info['relative_path'],
+                    'filename': file_info['filename'],
+                    'timestamp': timestamp.isoformat(),
+                    'record_count': len(df),
+                    'content_hash': content_hash,
+                    'hash_algo': CONTENT_HASH_ALGO,
+                    'columns': list(df.columns),
+                    'data_types': {col: str(dtype) for col, dtype in df.dtypes.items()},
+                    'file_size_bytes': 0  # Will be updated after file is written
                 }
-            
-            # Add new file information
-            file_metadata = {
-                'symbol': symbol,
-                'file_path': file_info['relative_path'],
-                'filename': file_info['filename'],
-                'timestamp': timestamp.isoformat(),
-                'record_count': len(df),
-                'content_hash': content_hash,
-                'columns': list(df.columns),
-                'data_types': {col: str(dtype) for col, dtype in df.dtypes.items()},
-                'file_size_bytes': 0  # Will be updated after file is written
-            }
-            
-            # Update file size if file exists
-            full_path = self.base_path / file_info['relative_path']
-            if full_path.exists():
-                file_metadata['file_size_bytes'] = full_path.stat().st_size
-            
-            metadata['files'].append(file_metadata)
-            metadata['last_updated'] = timestamp.isoformat()
-            metadata['total_files'] = len(metadata['files'])
-            metadata['total_records'] = sum(f['record_count'] for f in metadata['files'])
-            
-            # Write updated metadata
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+                
+                # Update file size if file exists
+                full_path = self.base_path / file_info['relative_path']
+                if full_path.exists():
+                    file_metadata['file_size_bytes'] = full_path.stat().st_size
+                
+                metadata['files'].append(file_metadata)
+                metadata['last_updated'] = timestamp.isoformat()
+                metadata['total_files'] = len(metadata['files'])
+                metadata['total_records'] = sum(f['record_count'] for f in metadata['files'])
+                
+                # Write updated metadata
+                await self._save_metadata(metadata_file, metadata)
             
             return True
             
@@ -288,8 +325,7 @@ async def read_data(self,
                 logger.warning(f"No metadata file found for {data_type}")
                 return None
             
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+            metadata = await self._load_metadata(metadata_file)
             
             # Find relevant files
             relevant_files = []
@@ -349,8 +385,7 @@ async def get_data_summary(self, data_type: str) -> Dict[str, Any]:
                     'date_range': None
                 }
             
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
+            metadata = await self._load_metadata(metadata_file)
             
             # Calculate summary statistics
             files = metadata.get('files', [])
@@ -393,29 +428,28 @@ async def cleanup_old_data(self, data_type: str, days_to_keep: int = 30) -> Dict
             if not metadata_file.exists():
                 return {'removed_files': 0, 'freed_bytes': 0}
             
-            with open(metadata_file, 'r') as f:
-                metadata = json.load(f)
-            
-            files_to_remove = []
-            freed_bytes = 0
-            
-            for file_info in metadata['files']:
-                file_timestamp = datetime.fromisoformat(file_info['timestamp'])
-                if file_timestamp < cutoff_date:
-                    file_path = self.base_path / file_info['file_path']
-                    if file_path.exists():
-                        freed_bytes += file_path.stat().st_size
-                        file_path.unlink()
-                    files_to_remove.append(file_info)
-            
-            # Update metadata
-            metadata['files'] = [f for f in metadata['files'] if f not in files_to_remove]
-            metadata['total_files'] = len(metadata['files'])
-            metadata['total_records'] = sum(f['record_count'] for f in metadata['files'])
-            metadata['last_cleanup'] = datetime.now().isoformat()
-            
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            async with self._metadata_lock(data_type):
+                metadata = await self._load_metadata(metadata_file)
+                
+                files_to_remove = []
+                freed_bytes = 0
+                
+                for file_info in metadata['files']:
+                    file_timestamp = datetime.fromisoformat(file_info['timestamp'])
+                    if file_timestamp < cutoff_date:
+                        file_path = self.base_path / file_info['file_path']
+                        if file_path.exists():
+                            freed_bytes += file_path.stat().st_size
+                            file_path.unlink()
+                        files_to_remove.append(file_info)
+                
+                # Update metadata
+                metadata['files'] = [f for f in metadata['files'] if f not in files_to_remove]
+                metadata['total_files'] = len(metadata['files'])
+                metadata['total_records'] = sum(f['record_count'] for f in metadata['files'])
+                metadata['last_cleanup'] = datetime.now().isoformat()
+                
+                await self._save_metadata(metadata_file, metadata)
             
             logger.info(f"Cleaned up {len(files_to_remove)} old files, freed {freed_bytes / (1024*1024):.2f} MB")
             
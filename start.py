@@ -332,7 +332,6 @@ async def calculate_with_real_data():
             emit_provenance("ai-block", **provenance)
             
         elif format.lower() == "json":
-            import json
             output = {
                 "symbol": symbol,
                 "date": date,
@@ -344,7 +343,12 @@ async def calculate_with_real_data():
                 },
                 "provenance": provenance
             }
-            print(json.dumps(output, indent=2, default=str))
+            try:
+                import orjson
+                print(orjson.dumps(output, option=orjson.OPT_INDENT_2, default=str).decode())
+            except ImportError:
+                import json
+                print(json.dumps(output, indent=2, default=str))
             
         elif format.lower() == "csv":
             print("symbol,date,R1,S1,VWAP,pivot,data_source,is_synthetic,vwap_method")
@@ -1,8 +1,6 @@
-import sys, pathlib, pytest
+import asyncio, copy, pathlib, pytest
 from unittest.mock import AsyncMock
 root = pathlib.Path(__file__).resolve().parents[1]
-if str(root) not in sys.path:
-    sys.path.insert(0, str(root))
 
 @pytest.fixture
 def mock_access_token(monkeypatch):
@@ -20,3 +18,27 @@ def mock_access_token(monkeypatch):
         raising=False
     )
     yield
+
+
+@pytest.fixture(scope="session")
+def base_config():
+    """Parse config.toml once per session; tests receive copies via ``cfg``."""
+    from app.config import Config
+    return Config(str(root / "config.toml"))
+
+
+@pytest.fixture
+def cfg(base_config):
+    """Per-test Config built from a deep copy of the session-parsed config."""
+    from app.config import Config
+    c = Config.__new__(Config)
+    c.__dict__.update(copy.deepcopy(base_config.__dict__))
+    return c
+
+
+@pytest.fixture(scope="session")
+def run_async():
+    """Run a coroutine to completion on one loop shared by sync tests (closed at session end)."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
@@ -1,4 +1,4 @@
-import asyncio
+import pytest
 from app.auth import AuthManager
 from app.config import Config
 
@@ -38,5 +38,6 @@ async def fake_request(token_url, data):  # noqa: D401
     assert 'default' not in am._load_pkce_state()
 
 
-def test_callback_success():
-    asyncio.run(_run_flow())
+@pytest.mark.serial
+def test_callback_success(run_async):
+    run_async(_run_flow())
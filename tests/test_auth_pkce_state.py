@@ -1,4 +1,5 @@
-import json, asyncio, os
+import json, os
+import pytest
 from app.auth import AuthManager
 from app.config import Config
 
@@ -15,5 +16,6 @@ async def _run_flow(simulate=False):
     assert not ok
 
 
-def test_pkce_state_mismatch():
-    asyncio.run(_run_flow(simulate=False))
+@pytest.mark.serial
+def test_pkce_state_mismatch(run_async):
+    run_async(_run_flow(simulate=False))
@@ -1,4 +1,3 @@
-import asyncio
 from app.error_handlers import handle_api_errors, handle_data_errors, error_registry, ErrorSeverity, error_handler
 
 @handle_api_errors
@@ -20,5 +19,5 @@ async def _run():
     assert 'RuntimeError' in stats['by_type'] and 'ValueError' in stats['by_type']
 
 
-def test_error_handler_decorators():
-    asyncio.run(_run())
+def test_error_handler_decorators(run_async):
+    run_async(_run())
@@ -4,14 +4,6 @@
 
 import json
 import pytest
-from pathlib import Path
-import sys
-
-# Add app to path for imports
-repo_root = Path(__file__).parent.parent
-app_dir = repo_root / "app"
-sys.path.insert(0, str(repo_root))
-sys.path.insert(0, str(app_dir))
 
 from app.errors import (
     ErrorCode, RetryStrategy, ERROR_TAXONOMY, create_error_envelope,
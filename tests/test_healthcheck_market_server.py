@@ -1,4 +1,5 @@
 import asyncio
+import collections
 import pytest
 from app.config import Config
 from app.healthcheck import HealthChecker
@@ -13,19 +14,14 @@ async def __aexit__(self, exc_type, exc, tb):
 
 class DummySession:
     def __init__(self, statuses):
-        self._statuses = statuses
-        self._idx = 0
+        self._q = collections.deque(statuses)
     async def __aenter__(self):
         return self
     async def __aexit__(self, exc_type, exc, tb):
         return False
     def get(self, url):
-        # Return next status; simulate 404 then 200, etc
-        if self._idx < len(self._statuses):
-            status = self._statuses[self._idx]
-            self._idx += 1
-        else:
-            status = 500
+        # Return next status; simulate 404 then 200, etc (500 once exhausted)
+        status = self._q.popleft() if self._q else 500
         return DummyResp(status)
 
 @pytest.mark.asyncio
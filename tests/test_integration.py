@@ -14,18 +14,13 @@
 from datetime import datetime, date
 import json
 
-# Add project paths
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
-
-from app.production_provider import ProductionDataProvider, OHLCData, IntradayBar
+from app.production_provider import ProductionDataProvider, OHLCData, IntradayBar, bars_to_structured, _vwap_kernel
 
 
 class TestProviderIntegration:
     """Test calc-levels integration with ProductionDataProvider"""
     
-    @pytest.mark.asyncio
-    async def test_calc_levels_calls_preflight_check(self):
+    def test_calc_levels_calls_preflight_check(self):
         """Verify calc-levels calls provider.preflight_check()"""
         
         # Mock the provider and its methods
@@ -57,8 +52,7 @@ async def test_calc_levels_calls_preflight_check(self):
             # Now preflight should have been called
             mock_provider.preflight_check.assert_called_once()
     
-    @pytest.mark.asyncio 
-    async def test_provider_ohlc_available_intraday_missing(self):
+    def test_provider_ohlc_available_intraday_missing(self):
         """Test scenario: OHLC data available but no intraday bars"""
         
         # Create mock OHLC data
@@ -126,8 +120,7 @@ async def test_provider_ohlc_available_intraday_missing(self):
                     assert json_output["levels"]["VWAP"] is None
                     assert json_output["provenance"]["vwap_method"] == "unavailable"
     
-    @pytest.mark.asyncio
-    async def test_provider_both_data_available(self):
+    def test_provider_both_data_available(self):
         """Test scenario: Both OHLC and intraday data available"""
         
         # Mock OHLC data
@@ -199,8 +192,7 @@ async def test_provider_both_data_available(self):
                     assert json_output["levels"]["VWAP"] == 169.35
                     assert json_output["provenance"]["vwap_method"] == "intraday_true"
     
-    @pytest.mark.asyncio
-    async def test_provider_auth_failure(self):
+    def test_provider_auth_failure(self):
         """Test provider authentication failure scenario"""
         
         mock_provider = Mock(spec=ProductionDataProvider)
@@ -276,6 +268,36 @@ def test_vwap_calculation_with_real_bars(self):
         assert vwap is not None, "VWAP should not be None with valid bars"
         assert abs(vwap - expected_vwap) < 0.001
     
+    def test_vwap_calculation_structured_bars(self):
+        """VWAP over a BAR_DTYPE array matches the per-bar list result"""
+        bars = [
+            IntradayBar(
+                timestamp=datetime(2025, 8, 18, 9, 30),
+                open=4200.0, high=4205.0, low=4198.0, close=4203.0, volume=100
+            ),
+            IntradayBar(
+                timestamp=datetime(2025, 8, 18, 9, 31),
+                open=4203.0, high=4208.0, low=4201.0, close=4206.0, volume=150
+            )
+        ]
+        
+        provider = ProductionDataProvider(Mock(), Mock())
+        packed = bars_to_structured(bars)
+        
+        assert packed['volume'].tolist() == [100, 150]
+        assert abs(provider.calculate_true_vwap(packed) - provider.calculate_true_vwap(bars)) < 1e-9
+    
+    def test_vwap_kernel_matches_golden_value(self):
+        """JIT (or pure-Python fallback) VWAP kernel matches the golden value"""
+        import numpy as np
+        high = np.array([4205.0, 4208.0, 4206.0])
+        low = np.array([4198.0, 4201.0, 4202.0])
+        close = np.array([4203.0, 4206.0, 4204.0])
+        volume = np.array([100.0, 150.0, 120.0])
+        
+        assert abs(_vwap_kernel(high, low, close, volume) - 1555430.0 / 370.0) < 0.001
+        assert _vwap_kernel(high, low, close, np.zeros(3)) == 0.0
+    
     def test_vwap_calculation_empty_bars(self):
         """Test VWAP calculation with no bars returns None"""
         provider = ProductionDataProvider(Mock(), Mock())
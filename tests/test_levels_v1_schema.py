@@ -5,15 +5,6 @@
 import json
 import pytest
 from datetime import date, datetime
-from pathlib import Path
-import sys
-import os
-
-# Add repository root and app to path for imports
-repo_root = Path(__file__).parent.parent
-app_dir = repo_root / "app"
-sys.path.insert(0, str(repo_root))
-sys.path.insert(0, str(app_dir))
 
 from app.schemas.levels_v1 import (
     create_levels_v1_output, 
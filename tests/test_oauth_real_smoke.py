@@ -1,4 +1,4 @@
-import os, asyncio, pytest
+import os, pytest
 from app.auth import AuthManager
 from app.config import Config
 
@@ -7,7 +7,8 @@
     'SCHWAB_CLIENT_SECRET',
 ]
 
-def test_real_oauth_smoke_skipped_if_missing_env():
+@pytest.mark.serial
+def test_real_oauth_smoke_skipped_if_missing_env(run_async):
     if any(not os.getenv(v) for v in REQUIRED_ENV) or os.getenv('SKIP_REAL_OAUTH', '1') == '1':
         pytest.skip('Real OAuth smoke skipped: credentials or flag missing')
 
@@ -24,4 +25,4 @@ async def _run():
         else:
             url = await am._build_auth_url('default')
             assert 'code_challenge' in url
-    asyncio.run(_run())
+    run_async(_run())
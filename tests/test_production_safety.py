@@ -6,60 +6,63 @@
 These tests would have caught the critical flaw where synthetic data was silently substituted.
 """
 
-import os
+import re
 import sys
 import pytest
-import asyncio
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime, date
-import json
-from contextlib import contextmanager
+from unittest.mock import patch
+import orjson
+from contextlib import redirect_stdout
 from io import StringIO
 
-# Add app to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'app'))
-
 from app.guardrails import assert_no_stub, require, fail_fast, create_provenance_data, emit_provenance
+import start
+from start import calc_levels
+
+_AI_BLOCK_RE = re.compile(r'\[AI_DATA_BLOCK_START\]\nR1: \S+\nS1: \S+\nVWAP: \S+\n\[AI_DATA_BLOCK_END\]')
 
 
 class TestGuardrails:
     """Test the production safety guardrails"""
     
-    def test_assert_no_stub_allows_execution_in_dev_mode(self):
-        """FAIL_ON_STUB=0 should allow stub execution"""
-        with patch.dict(os.environ, {'FAIL_ON_STUB': '0'}, clear=False):
-            # Should not raise
-            assert_no_stub()
-    
-    def test_assert_no_stub_blocks_execution_in_production(self):
-        """FAIL_ON_STUB=1 must raise SystemExit with E-STUB-PATH"""
-        with patch.dict(os.environ, {'FAIL_ON_STUB': '1'}, clear=False):
+    @pytest.mark.parametrize("fail_on_stub,expect_exit", [("0", False), ("1", True)])
+    def test_assert_no_stub(self, monkeypatch, capsys, fail_on_stub, expect_exit):
+        """FAIL_ON_STUB=0 allows stub execution; FAIL_ON_STUB=1 must raise E-STUB-PATH"""
+        monkeypatch.setenv("FAIL_ON_STUB", fail_on_stub)
+        if expect_exit:
             with pytest.raises(SystemExit) as excinfo:
                 assert_no_stub()
             
-            # Verify it's the correct error
-            assert "E-STUB-PATH" in str(excinfo.value)
+            # Verify it's the correct error; the code is reported on stderr
+            assert excinfo.value.code == 2
+            assert "E-STUB-PATH" in capsys.readouterr().err
+        else:
+            # Should not raise
+            assert_no_stub()
     
     def test_require_passes_when_condition_true(self):
         """require() should pass when condition is True"""
         # Should not raise
         require(True, "E-TEST", "This should not fail")
     
-    def test_require_fails_when_condition_false(self):
+    def test_require_fails_when_condition_false(self, capsys):
         """require() must fail fast when condition is False"""
         with pytest.raises(SystemExit) as excinfo:
             require(False, "E-TEST", "This should fail")
         
-        assert "E-TEST" in str(excinfo.value)
-        assert "This should fail" in str(excinfo.value)
+        assert excinfo.value.code == 2
+        err = capsys.readouterr().err
+        assert "E-TEST" in err
+        assert "This should fail" in err
     
-    def test_fail_fast_exits_with_error_code(self):
+    def test_fail_fast_exits_with_error_code(self, capsys):
         """fail_fast() must exit with proper error code and message"""
         with pytest.raises(SystemExit) as excinfo:
             fail_fast("E-CALC-FAILED", "Test failure message")
         
-        assert "E-CALC-FAILED" in str(excinfo.value)
-        assert "Test failure message" in str(excinfo.value)
+        assert excinfo.value.code == 2
+        err = capsys.readouterr().err
+        assert "E-CALC-FAILED" in err
+        assert "Test failure message" in err
     
     def test_create_provenance_data_structure(self):
         """Provenance data must include all required fields"""
@@ -77,6 +80,8 @@ def test_create_provenance_data_structure(self):
         assert provenance["provider_request_id"] == "test-123"
         assert provenance["source_session"] == "2025-08-18 09:30–16:00 ET"
         assert "timestamp" in provenance
+        ts = provenance["timestamp"]
+        assert ts.endswith("Z") and len(ts) == len("2025-08-22T12:00:00.000Z")
     
     @patch('sys.stderr', new_callable=StringIO)
     def test_emit_provenance_to_stderr(self, mock_stderr):
@@ -96,6 +101,13 @@ def test_emit_provenance_to_stderr(self, mock_stderr):
         assert "data_source=schwab" in stderr_output
         assert "is_synthetic=false" in stderr_output
         assert "vwap_method=intraday_true" in stderr_output
+    
+    @patch('sys.stderr', new_callable=StringIO)
+    def test_emit_provenance_partial_fields(self, mock_stderr):
+        """Non-standard field sets fall back to generic key=value formatting"""
+        emit_provenance("ai-block", data_source="schwab", is_synthetic=True, provider_request_id=None)
+        
+        assert mock_stderr.getvalue() == "[PROVENANCE] data_source=schwab is_synthetic=true provider_request_id=N/A\n"
 
 
 class TestPivotCalculations:
@@ -118,24 +130,16 @@ def test_pivot_calculation_golden_values(self):
     
     def test_vwap_calculation_synthetic_bars(self):
         """Test VWAP calculation from synthetic minute bars with known values"""
-        from app.production_provider import IntradayBar, ProductionDataProvider
+        import numpy as np
+        from app.production_provider import BAR_DTYPE, ProductionDataProvider
         from datetime import datetime
         
-        # Create synthetic bars with known values
-        bars = [
-            IntradayBar(
-                timestamp=datetime(2025, 8, 18, 9, 30),
-                open=100.0, high=101.0, low=99.0, close=100.5, volume=1000
-            ),
-            IntradayBar(
-                timestamp=datetime(2025, 8, 18, 9, 31),
-                open=100.5, high=102.0, low=100.0, close=101.5, volume=2000
-            ),
-            IntradayBar(
-                timestamp=datetime(2025, 8, 18, 9, 32),
-                open=101.5, high=101.5, low=100.5, close=101.0, volume=1500
-            )
-        ]
+        # Synthetic bars in columnar (structured array) layout
+        bars = np.array([
+            (datetime(2025, 8, 18, 9, 30), 100.0, 101.0, 99.0, 100.5, 1000),
+            (datetime(2025, 8, 18, 9, 31), 100.5, 102.0, 100.0, 101.5, 2000),
+            (datetime(2025, 8, 18, 9, 32), 101.5, 101.5, 100.5, 101.0, 1500),
+        ], dtype=BAR_DTYPE)
         
         # Calculate VWAP manually for verification
         # Bar 1: typical_price = (101+99+100.5)/3 = 100.1667, pv = 100166.7
@@ -143,61 +147,74 @@ def test_vwap_calculation_synthetic_bars(self):
         # Bar 3: typical_price = (101.5+100.5+101)/3 = 101.0000, pv = 151500.0
         # Total PV = 454000.0, Total Volume = 4500, VWAP = 100.8889
         
-        provider = Mock()
-        provider.calculate_true_vwap = ProductionDataProvider.calculate_true_vwap
-        
-        vwap = provider.calculate_true_vwap(provider, bars)
-        assert abs(vwap - 100.8889) < 0.0001
+        vwap = ProductionDataProvider.calculate_true_vwap(bars)
+        assert np.isclose(vwap, 100.8889, atol=1e-4)
+
+
+class StubProvider:
+    """Lightweight stand-in for ProductionDataProvider (no Mock machinery)."""
+    
+    def __init__(self, daily_ohlc=None, intraday_bars=None, daily_error=None):
+        self.request_id = "test-123"
+        self.preflight_calls = 0
+        self.vwap_calls = []
+        self._daily_ohlc = daily_ohlc
+        self._intraday_bars = intraday_bars or []
+        self._daily_error = daily_error
+    
+    async def preflight_check(self):
+        self.preflight_calls += 1
+        return {"auth": "ok"}
+    
+    async def get_daily_ohlc(self, symbol, target_date):
+        if self._daily_error:
+            raise SystemExit(self._daily_error)
+        return self._daily_ohlc
+    
+    async def get_intraday_bars(self, symbol, target_date, session="rth"):
+        return self._intraday_bars
+    
+    def calculate_true_vwap(self, intraday_bars):
+        self.vwap_calls.append(intraday_bars)
+        return None
+    
+    def create_session_info(self, target_date, session_type="rth"):
+        return "test-session"
 
 
 class TestProductionProviderIntegration:
-    """Integration tests with mock provider to verify call patterns"""
+    """Integration tests with stub provider to verify call patterns"""
     
-    @pytest.mark.asyncio
-    async def test_provider_preflight_check_called(self):
+    def test_provider_preflight_check_called(self):
         """Ensure calc_levels calls provider preflight check"""
-        from app.production_provider import ProductionDataProvider
-        from app.config import Config
-        from app.auth import AuthManager
-        
         with patch('app.config.Config') as mock_config, \
              patch('app.auth.AuthManager') as mock_auth:
             
-            mock_provider = Mock(spec=ProductionDataProvider)
-            mock_provider.preflight_check = Mock(return_value={"auth": "ok"})
-            mock_provider.get_daily_ohlc = Mock(side_effect=SystemExit("E-NODATA-DAILY"))
+            mock_provider = StubProvider(daily_error="E-NODATA-DAILY")
             
             with patch('app.production_provider.ProductionDataProvider', return_value=mock_provider):
                 # This should call preflight_check
-                from start import calc_levels
-                
                 with pytest.raises(SystemExit):
                     calc_levels("/NQ", "2025-08-18", "json")
                 
                 # Verify preflight was called
-                mock_provider.preflight_check.assert_called_once()
+                assert mock_provider.preflight_calls == 1
     
-    @pytest.mark.asyncio
-    async def test_no_intraday_data_returns_vwap_unavailable(self):
+    def test_no_intraday_data_returns_vwap_unavailable(self):
         """When provider returns no intraday data, JSON must include vwap_method:unavailable"""
-        from app.production_provider import ProductionDataProvider, OHLCData
-        from datetime import datetime, date
-        
-        mock_provider = Mock(spec=ProductionDataProvider)
-        mock_provider.preflight_check = Mock(return_value={"auth": "ok"})
+        from app.production_provider import OHLCData
+        from datetime import datetime
         
-        # Mock OHLC data available but no intraday bars
+        # OHLC data available but no intraday bars
         mock_ohlc = OHLCData(
             open=169.0, high=170.0, low=168.0, close=169.5, 
             volume=100000, timestamp=datetime.now()
         )
-        mock_provider.get_daily_ohlc = Mock(return_value=mock_ohlc)
-        mock_provider.get_intraday_bars = Mock(return_value=[])  # No bars
-        mock_provider.calculate_true_vwap = Mock(return_value=None)
-        mock_provider.create_session_info = Mock(return_value="test-session")
-        mock_provider.request_id = "test-123"
+        mock_provider = StubProvider(daily_ohlc=mock_ohlc, intraday_bars=[])
         
-        with patch('app.production_provider.ProductionDataProvider', return_value=mock_provider), \
+        with patch('app.config.Config'), \
+             patch('app.auth.AuthManager'), \
+             patch('app.production_provider.ProductionDataProvider', return_value=mock_provider), \
              patch('app.guardrails.create_provenance_data') as mock_provenance:
             
             mock_provenance.return_value = {
@@ -209,21 +226,20 @@ async def test_no_intraday_data_returns_vwap_unavailable(self):
                 "timestamp": "2025-08-22T12:00:00Z"
             }
             
-            # Import after patching
-            from start import calc_levels
-            
             # Capture output
             with patch('builtins.print') as mock_print, \
                  patch('sys.exit') as mock_exit:
                 
                 calc_levels("/NQ", "2025-08-18", "json")
                 
+                assert mock_provider.vwap_calls == [[]]
+                
                 # Find the JSON output
                 json_output = None
                 for call in mock_print.call_args_list:
                     if call[0] and isinstance(call[0][0], str):
                         try:
-                            json_output = json.loads(call[0][0])
+                            json_output = orjson.loads(call[0][0])
                             break
                         except:
                             continue
@@ -237,9 +253,8 @@ async def test_no_intraday_data_returns_vwap_unavailable(self):
 class TestCLIOutputContracts:
     """Contract tests for CLI output formats"""
     
-    @patch('sys.stdout', new_callable=StringIO)
     @patch('sys.stderr', new_callable=StringIO)
-    def test_ai_block_format_exact_snapshot(self, mock_stderr, mock_stdout):
+    def test_ai_block_format_exact_snapshot(self, mock_stderr):
         """Snapshot test for --format ai-block (exact block format)"""
         # Mock the calc_levels function to produce known output
         with patch('start.calc_levels') as mock_calc:
@@ -257,19 +272,14 @@ def mock_calc_func(symbol, date, format):
             
             mock_calc.side_effect = mock_calc_func
             
-            # Run the function
-            from start import calc_levels
-            calc_levels("/NQ", "2025-08-18", "ai-block")
+            # Run the function (through the module so the patch applies)
+            buf = StringIO(newline='')
+            with redirect_stdout(buf):
+                start.calc_levels("/NQ", "2025-08-18", "ai-block")
             
             # Verify exact AI block format
-            stdout_output = mock_stdout.getvalue()
-            lines = stdout_output.strip().split('\n')
-            
-            assert lines[0] == "[AI_DATA_BLOCK_START]"
-            assert lines[1].startswith("R1: ")
-            assert lines[2].startswith("S1: ")
-            assert lines[3].startswith("VWAP: ")
-            assert lines[4] == "[AI_DATA_BLOCK_END]"
+            stdout_output = buf.getvalue()
+            assert _AI_BLOCK_RE.search(stdout_output)
             
             # Verify provenance in STDERR
             stderr_output = mock_stderr.getvalue()
@@ -308,8 +318,9 @@ class TestSmokeTests:
     """Smoke tests that require real credentials (staging environment)"""
     
     @pytest.mark.smoke
+    @pytest.mark.serial
     @pytest.mark.asyncio
-    async def test_diag_provider_auth_ok(self):
+    async def test_diag_provider_auth_ok(self, capsys):
         """ta diag provider should return auth:ok with valid credentials"""
         from app.production_provider import run_diagnostics
         
@@ -318,8 +329,8 @@ async def test_diag_provider_auth_ok(self):
             assert result.get("auth") == "ok"
             assert "provider" in result
             assert "time" in result
-        except SystemExit as e:
-            if "E-AUTH" in str(e):
+        except SystemExit:
+            if "E-AUTH" in capsys.readouterr().err:
                 pytest.skip("No valid credentials available for smoke test")
             else:
                 raise
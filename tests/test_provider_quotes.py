@@ -1,19 +1,27 @@
-import asyncio
+import numpy as np
+import pytest
 from app.config import Config
 from app.auth import AuthManager
 from app.providers import get_provider
 
-def test_schwab_quotes_simulate():
+
+def _assert_quote_invariants(records):
+    """Vectorized bid/ask sanity check across a batch of quote records."""
+    n = len(records)
+    bids = np.fromiter((r['bid'] for r in records), dtype='f8', count=n)
+    asks = np.fromiter((r['ask'] for r in records), dtype='f8', count=n)
+    assert np.all(asks >= bids)
+
+@pytest.mark.asyncio
+async def test_schwab_quotes_simulate():
     cfg = Config()
     cfg.set('auth.simulate', True)
     auth = AuthManager(cfg)
     client = get_provider('schwab', cfg, auth)
     symbols = ['AAPL', 'MSFT']
-    result = asyncio.run(client.quotes(symbols))
+    result = await client.quotes(symbols)
     assert 'records' in result and 'normalized' in result
     assert len(result['records']) == len(symbols)
     assert result['validation']['is_valid'] is True
-    sym_set = {r['symbol'] for r in result['normalized']}
-    assert sym_set == {s.upper() for s in symbols}
-    for rec in result['records']:
-        assert rec['ask'] >= rec['bid']
+    assert frozenset(r['symbol'] for r in result['normalized']) == frozenset(s.upper() for s in symbols)
+    _assert_quote_invariants(result['records'])
@@ -1,8 +1,12 @@
+import re
+
 import pytest
 
+_RFC3339_MS = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$')
+
 
 @pytest.mark.asyncio
-async def test_quotes_returns_validation_on_missing_token(monkeypatch):
+async def test_quotes_returns_validation_on_missing_token(monkeypatch, cfg):
     """SchwabClient.quotes should return structured validation block when no token.
 
     Ensures:
@@ -12,13 +16,11 @@ async def test_quotes_returns_validation_on_missing_token(monkeypatch):
       - RFC3339 timestamp with 'Z' and millisecond component
     """
     from app.providers.schwab import SchwabClient
-    from app.config import Config
 
     class DummyAuth:
         async def get_access_token(self, provider: str):  # signature matches AuthManager
             return None
 
-    cfg = Config('config.toml')
     cfg.config_data.setdefault('auth', {})['simulate'] = False  # force live path
     # base_url not required; missing token short-circuits before HTTP
 
@@ -31,4 +33,4 @@ async def get_access_token(self, provider: str):  # signature matches AuthManage
     assert 'reason' in out['validation']
     assert out.get('normalized') == []
     ts = out.get('ts')
-    assert isinstance(ts, str) and ts.endswith('Z') and '.' in ts  # RFC3339 with ms
+    assert isinstance(ts, str) and _RFC3339_MS.fullmatch(ts)  # RFC3339 with ms
@@ -3,6 +3,7 @@
 from app.auth import AuthManager
 from app.providers import get_provider
 
+@pytest.mark.serial
 @pytest.mark.asyncio
 async def test_schwab_client_ping_simulate():
     cfg = Config()
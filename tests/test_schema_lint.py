@@ -2,6 +2,7 @@
 
 import pytest
 import json
+import numpy as np
 import pandas as pd
 from datetime import datetime, date
 from app.schemas.quotes import (
@@ -76,6 +77,19 @@ def test_validate_invalid_quotes(self):
         assert result['is_valid'] is False
         assert len(result['errors']) > 0
     
+    def test_validate_quote_values_per_field(self):
+        """None fields, bad casts and the bid/ask short-circuit keep their messages"""
+        quote = {'symbol': 'AAPL', 'bid': None, 'ask': 'x', 'timestamp': '2024-01-01T10:00:00',
+                 'bid_size': '1.5', 'ask_size': None}
+        result = validate_quote_data([quote, {**quote, 'bid': -1.0, 'ask': 'x'}])
+        assert result['errors'] == [
+            "Record 0: Missing required field 'bid'",
+            "Record 0: Non-numeric bid/ask",
+            "Record 1: Bid must be positive",
+            "Record 1: Non-numeric bid/ask",
+        ]
+        assert result['warnings'] == ["Record 0: bid_size not integer", "Record 1: bid_size not integer"]
+    
     def test_normalize_quotes(self):
         """Test quote data normalization"""
         normalized = normalize_quote_data(self.valid_quote_data)
@@ -147,6 +161,16 @@ def test_validate_invalid_ohlc(self):
         assert result['is_valid'] is False
         assert len(result['errors']) > 0
     
+    def test_validate_ohlc_none_values(self):
+        """A key set to None is present but fails its type check"""
+        record = {**self.valid_ohlc_data[0], 'open': None, 'volume': None, 'timestamp': None}
+        result = validate_ohlc_data([record])
+        assert result['errors'] == [
+            "Record 0: Invalid price data types",
+            "Record 0: Invalid volume data type",
+            "Record 0: Invalid timestamp format",
+        ]
+    
     def test_normalize_ohlc(self):
         """Test OHLC data normalization"""
         normalized = normalize_ohlc_data(self.valid_ohlc_data)
@@ -155,6 +179,20 @@ def test_normalize_ohlc(self):
         ohlc = normalized[0]
         assert all(isinstance(ohlc[field], float) for field in ['open', 'high', 'low', 'close'])
     
+    def test_normalize_ohlc_mixed_price_values(self):
+        """Prices cast like float() per record, and a bad price raises float()'s own error"""
+        record = self.valid_ohlc_data[0]
+        text_prices = {**record, 'open': '150.5', 'high': '1_000'}
+        no_close = {k: v for k, v in record.items() if k != 'close'}
+        normalized = normalize_ohlc_data([record, text_prices, no_close])
+        assert normalized[1]['open'] == 150.5 and normalized[1]['high'] == 1000.0
+        assert 'close' not in normalized[2]
+        
+        with pytest.raises(ValueError, match="'abc'"):
+            normalize_ohlc_data([record, {**record, 'low': 'abc'}])
+        with pytest.raises(TypeError):
+            normalize_ohlc_data([record, {**record, 'low': None}])
+    
     def test_create_ohlc_dataframe(self):
         """Test creating DataFrame from OHLC data"""
         df = create_ohlc_dataframe(self.valid_ohlc_data)
@@ -239,6 +277,27 @@ def test_calculate_options_metrics(self):
         
         assert 'record_count' in metrics
         assert 'unique_strikes' in metrics
+    
+    @pytest.mark.parametrize("option_types,expected", [
+        (['CALL', 'call'], {'call': 2}),
+        ([None, None], {}),
+    ])
+    def test_option_type_distribution(self, option_types, expected):
+        """Option types are lower-cased before the categorical cast and unseen types are not counted"""
+        data = [{**self.valid_options_data[0], 'option_type': t} for t in option_types]
+        df = create_options_dataframe(data)
+        assert list(df['option_type'].cat.categories) == ['call', 'put']
+        assert calculate_options_metrics(df)['option_type_distribution'] == expected
+    
+    def test_unexpected_option_type_is_kept(self, caplog):
+        """Values outside call/put survive the categorical cast and are logged"""
+        data = [{**self.valid_options_data[0], 'option_type': t} for t in ['CALLS', None, 'put']]
+        df = create_options_dataframe(data)
+        assert df['option_type'].dtype == 'category'
+        assert df['option_type'].iloc[0] == 'calls'
+        assert pd.isna(df['option_type'].iloc[1])
+        assert df['option_type'].iloc[2] == 'put'
+        assert "Unexpected option_type values ['calls']" in caplog.text
 
 
 class TestTimeSalesSchema:
@@ -279,6 +338,14 @@ def test_validate_invalid_timesales(self):
         assert result['is_valid'] is False
         assert len(result['errors']) > 0
     
+    def test_validate_timesales_none_values(self):
+        """None fails the exchange check but skips the optional field checks"""
+        record = {**self.valid_timesales_data[0], 'exchange': None, 'side': None,
+                  'conditions': None, 'sequence': None}
+        result = validate_timesales_data([record])
+        assert result['errors'] == ["Record 0: Exchange must be a string"]
+        assert result['warnings'] == []
+    
     def test_normalize_timesales(self):
         """Test time and sales data normalization"""
         normalized = normalize_timesales_data(self.valid_timesales_data)
@@ -346,6 +413,24 @@ def test_timestamp_formats(self):
             # Should not fail on valid timestamp formats
             assert 'timestamp' not in str(result.get('errors', []))
     
+    def test_non_iso_timestamps(self):
+        """DataFrame builders parse non-ISO timestamps, alone or mixed with ISO ones"""
+        stamps = ['01/19/2024 16:00', '2024-01-20T16:00:00']
+        expected = [pd.Timestamp('2024-01-19 16:00'), pd.Timestamp('2024-01-20 16:00')]
+        
+        ohlc = [{'symbol': 'AAPL', 'timestamp': ts, 'open': 1.0, 'high': 1.0, 'low': 1.0,
+                 'close': 1.0, 'volume': 1} for ts in stamps]
+        parsed = create_ohlc_dataframe(ohlc)['timestamp'].dt.tz_localize(None)
+        assert parsed.tolist() == expected
+        
+        trades = [{'symbol': 'AAPL', 'timestamp': ts, 'price': 1.0, 'size': 1,
+                   'exchange': 'NASDAQ'} for ts in stamps]
+        assert create_timesales_dataframe(trades)['timestamp'].tolist() == expected
+        
+        options = [{'symbol': 'AAPL240119C00150000', 'underlying_symbol': 'AAPL',
+                    'option_type': 'call', 'strike': 150.0, 'expiration': ts} for ts in stamps]
+        assert create_options_dataframe(options)['expiration'].tolist() == expected
+    
     def test_numeric_type_handling(self):
         """Test numeric type handling consistency"""
         # Test with integers and floats
@@ -368,23 +453,40 @@ class TestPerformance:
     
     def test_large_dataset_validation(self):
         """Test validation performance with larger datasets"""
-        # Create 1000 quote records
-        large_dataset = []
-        for i in range(1000):
-            large_dataset.append({
-                'symbol': f'SYM{i:03d}',
-                'bid': 100.0 + i * 0.01,
-                'ask': 100.05 + i * 0.01,
-                'timestamp': f'2024-01-01T{i % 24:02d}:00:00'
-            })
+        # Create 1000 quote records column-wise
+        n = 1000
+        steps = 0.01 * np.arange(n, dtype=np.float64)
+        large_dataset = pd.DataFrame({
+            'symbol': [f'SYM{i:03d}' for i in range(n)],
+            'bid': 100.0 + steps,
+            'ask': 100.05 + steps,
+            'timestamp': [f'2024-01-01T{i % 24:02d}:00:00' for i in range(n)]
+        })
         
         result = validate_quote_data(large_dataset)
         assert result['record_count'] == 1000
+        assert result['is_valid'] is True
         
         # Should complete in reasonable time
-        df = create_quotes_dataframe(large_dataset)
+        df = create_quotes_dataframe(large_dataset.to_dict('records'))
         assert len(df) == 1000
     
+    def test_polars_screen_matches_pandas(self, monkeypatch):
+        """Polars fast path returns the pandas result for clean and dirty batches"""
+        pytest.importorskip('polars')
+        clean = [
+            {'symbol': f'SYM{i:03d}', 'bid': 100.0 + i, 'ask': 100.5 + i,
+             'timestamp': '2024-01-01T10:00:00'}
+            for i in range(600)
+        ]
+        dirty = [dict(r) for r in clean]
+        dirty[10]['bid'] = -1.0
+        dirty[20]['ask'] = 1.0
+        
+        expected = [validate_quote_data(clean), validate_quote_data(dirty)]
+        monkeypatch.setenv('SCHEMA_POLARS', '1')
+        assert [validate_quote_data(clean), validate_quote_data(dirty)] == expected
+    
     def test_dataframe_memory_usage(self):
         """Test DataFrame memory efficiency"""
         # Create dataset and check memory usage
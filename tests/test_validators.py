@@ -10,6 +10,7 @@
     validate_price,
     validate_volume,
     validate_timestamp,
+    validate_timestamps_bulk,
     validate_exchange,
     validate_option_symbol,
     validate_strike_price,
@@ -157,6 +158,43 @@ def test_future_timestamps(self):
         future_time = datetime.now().replace(year=2030)
         assert validate_timestamp(future_time, allow_future=True) is True
         assert validate_timestamp(future_time, allow_future=False) is False
+    
+    @pytest.mark.parametrize("timestamp", [
+        "2025-01-02T10:00:00.123456789Z",
+        "2025-01-02T10:00:00+05",
+        "20250102T100000",
+        "2025-01-02T10:00:00,5",
+        "2025-W01-1",
+        "2025-01-02T10",
+        "2025-01-02 10:00",
+        "2025-13-02",
+        "",
+        "not_a_date",
+    ])
+    def test_matches_fromisoformat(self, timestamp):
+        """Strings are accepted exactly when datetime.fromisoformat parses them"""
+        try:
+            datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            expected = True
+        except ValueError:
+            expected = False
+        assert validate_timestamp(timestamp, allow_future=True) is expected
+    
+    def test_bulk_matches_scalar(self):
+        """Bulk timestamp validation agrees with validate_timestamp"""
+        timestamps = [
+            "2024-01-01T10:00:00",
+            "2024-01-01T10:00:00Z",
+            "2024-01-01T10:00:00+00:00",
+            "2024-13-01T10:00:00",
+            "2030-01-01T10:00:00Z",
+            "not_a_date",
+            datetime.now(),
+            None,
+        ]
+        for kwargs in ({}, {'allow_future': True}, {'max_age_days': 30}):
+            expected = [validate_timestamp(ts, **kwargs) for ts in timestamps]
+            assert validate_timestamps_bulk(timestamps, **kwargs) == expected
 
 
 class TestExchangeValidation:
@@ -0,0 +1,67 @@
+"""Tests for the OHLC verification script (verify_data.py)"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from verify_data import OHLCVerifier
+
+
+def _bar(**overrides):
+    bar = {
+        'symbol': 'AAPL',
+        'timestamp': '2025-08-18T20:00:00Z',
+        'datetime': '2025-08-18T20:00:00Z',
+        'open': 100.0,
+        'high': 105.0,
+        'low': 99.0,
+        'close': 104.0,
+        'volume': 1_000_000,
+        'vwap': 103.0,
+    }
+    bar.update(overrides)
+    return bar
+
+
+def _verifier(bars):
+    """Verifier wired to canned historical bars and no live quote"""
+    verifier = OHLCVerifier.__new__(OHLCVerifier)
+    verifier.historical = Mock(get_latest_ohlc=AsyncMock(return_value=bars))
+    verifier.schwab_client = Mock(quotes=AsyncMock(return_value={'records': []}))
+    return verifier
+
+
+@pytest.mark.asyncio
+async def test_missing_vwap_only_fails_pivot_check():
+    bars = [_bar(vwap=None), _bar(close=103.0), _bar(close=102.0)]
+    results = await _verifier(bars).verify_ohlc_data('AAPL', '2025-08-18')
+
+    assert 'error' not in results
+    methods = results['methods']
+    assert methods['pivot_verification']['status'] == 'ERROR'
+    assert methods['mathematical_consistency']['status'] == 'PASS'
+    assert methods['market_reasonableness']['status'] == 'PASS'
+    assert methods['trend_analysis']['status'] == 'PASS'
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("closes", [[104.0, 0.0, 102.0], [104.0, float('nan'), 102.0]])
+async def test_trend_analysis_reports_unusable_closes(closes):
+    bars = [_bar(close=close) for close in closes]
+    result = await _verifier(bars)._validate_historical_trends(bars)
+
+    assert result['status'] == 'ERROR'
+    assert result['score'] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_schema_verdict_does_not_depend_on_earlier_records():
+    good = [_bar()]
+    bad = [_bar(high=5.0, low=20.0)]
+    verifier = _verifier(good)
+
+    assert (await verifier._validate_schema(good))['status'] == 'PASS'
+    result = await verifier._validate_schema(bad)
+
+    assert result['status'] == 'FAIL'
+    assert "Record 0: High price lower than open/close" in result['details']['errors']
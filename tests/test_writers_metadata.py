@@ -1,8 +1,8 @@
-import asyncio
 import json
 import pandas as pd
+import pytest
 from pathlib import Path
-from app.writers import ParquetWriter
+from app.writers import CONTENT_HASH_ALGO, ParquetWriter
 
 async def _write_and_check(tmp_path: Path):
     base = tmp_path / 'data_store'
@@ -14,6 +14,7 @@ async def _write_and_check(tmp_path: Path):
     assert meta_file.exists()
     meta = json.loads(meta_file.read_text())
     assert meta['total_files'] == 1
+    assert meta['files'][0]['hash_algo'] == CONTENT_HASH_ALGO
     # duplicate write
     res2 = await writer.write_data(df, data_type='historical', symbol='AAPL')
     assert res2['status'] == 'skipped' and res2['reason'] == 'duplicate_data'
@@ -21,5 +22,6 @@ async def _write_and_check(tmp_path: Path):
     assert meta_after['total_files'] == 1
 
 
-def test_parquet_writer_metadata(tmp_path):
-    asyncio.run(_write_and_check(tmp_path))
+@pytest.mark.asyncio
+async def test_parquet_writer_metadata(tmp_path):
+    await _write_and_check(tmp_path)
@@ -3,169 +3,81 @@
 Simple Production Safety Verification
 
 Quick verification that the production safety system is working correctly.
+
+Run with: pytest tests/verify_production_safety.py
 """
 
-import os
-import sys
-from pathlib import Path
+import importlib
+
+import pytest
+
+# Guardrails module, imported on first use and shared by the checks below
+_guardrails = None
+
+
+def _gr():
+    """Return the app.guardrails module, importing it only once"""
+    global _guardrails
+    if _guardrails is None:
+        import app.guardrails as guardrails
+        _guardrails = guardrails
+    return _guardrails
+
+
+@pytest.mark.parametrize("fail_on_stub,should_exit", [("0", False), ("1", True)])
+def test_assert_no_stub(monkeypatch, capsys, fail_on_stub, should_exit):
+    """Development mode allows execution; production mode blocks it with E-STUB-PATH"""
+    monkeypatch.setenv("FAIL_ON_STUB", fail_on_stub)
+    if should_exit:
+        # The error code goes to stderr; SystemExit only carries the exit code
+        with pytest.raises(SystemExit) as excinfo:
+            _gr().assert_no_stub()
+        assert excinfo.value.code == 2
+        assert "E-STUB-PATH" in capsys.readouterr().err
+    else:
+        _gr().assert_no_stub()
+
+
+@pytest.mark.parametrize("condition,should_exit", [(True, False), (False, True)])
+def test_require(condition, should_exit):
+    """require() passes when the condition holds and exits with code 2 otherwise"""
+    if should_exit:
+        # require() prints the message to stderr and raises SystemExit(2)
+        with pytest.raises(SystemExit) as excinfo:
+            _gr().require(condition, "E-TEST", "Should fail")
+        assert excinfo.value.code == 2
+    else:
+        _gr().require(condition, "E-TEST", "Should not fail")
+
 
-# Add app to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "app"))
+def test_provenance_data():
+    """Provenance data includes every required field"""
+    provenance = _gr().create_provenance_data(
+        provider="schwab",
+        is_synthetic=False,
+        vwap_method="intraday_true",
+        provider_request_id="test-123",
+        source_session="test-session"
+    )
 
+    required_fields = ["data_source", "is_synthetic", "vwap_method",
+                      "provider_request_id", "source_session", "timestamp"]
+
+    for field in required_fields:
+        assert field in provenance, f"Missing provenance field: {field}"
+
+
+def test_calc_levels_integration(monkeypatch):
+    """calc_levels must fail explicitly in production mode"""
+    monkeypatch.setenv("FAIL_ON_STUB", "1")
 
-def test_production_safety():
-    """Test that production safety system works"""
-    
-    print("Production Safety Verification")
-    print("=" * 40)
-    
     try:
-        from app.guardrails import assert_no_stub, require, fail_fast, create_provenance_data
-        print("[OK] Imported guardrails module")
+        # Import only now, with production mode set, to avoid logging conflicts
+        start = importlib.import_module("start")
     except ImportError as e:
-        print(f"[FAIL] Could not import guardrails: {e}")
-        return False
-    
-    # Test 1: Development mode allows execution
-    print("\nTest 1: Development mode (FAIL_ON_STUB=0)")
-    os.environ['FAIL_ON_STUB'] = '0'
-    try:
-        assert_no_stub()
-        print("[PASS] Development mode allows execution")
-    except SystemExit:
-        print("[FAIL] Development mode should allow execution")
-        return False
-    
-    # Test 2: Production mode blocks execution
-    print("\nTest 2: Production mode (FAIL_ON_STUB=1)")
-    os.environ['FAIL_ON_STUB'] = '1'
-    try:
-        assert_no_stub()
-        print("[FAIL] Production mode should block execution")
-        return False
-    except SystemExit as e:
-        if "E-STUB-PATH" in str(e):
-            print("[PASS] Production mode correctly blocks execution")
-        else:
-            print(f"[FAIL] Wrong error message: {e}")
-            return False
-    
-    # Test 3: require() function
-    print("\nTest 3: require() function")
-    try:
-        require(True, "E-TEST", "Should not fail")
-        print("[PASS] require() passes when condition is True")
-    except SystemExit:
-        print("[FAIL] require() should not fail when condition is True")
-        return False
-    
-    try:
-        require(False, "E-TEST", "Should fail")
-        print("[FAIL] require() should fail when condition is False")
-        return False
-    except SystemExit as e:
-        # require() prints to stderr and raises SystemExit(2)
-        # The error message was already printed to stderr, so exit code 2 is correct
-        if e.code == 2:
-            print("[PASS] require() correctly fails when condition is False")
-        else:
-            print(f"[FAIL] Wrong exit code: {e.code}")
-            return False
-    
-    # Test 4: Provenance data creation
-    print("\nTest 4: Provenance data")
-    try:
-        provenance = create_provenance_data(
-            provider="schwab",
-            is_synthetic=False,
-            vwap_method="intraday_true",
-            provider_request_id="test-123",
-            source_session="test-session"
-        )
-        
-        required_fields = ["data_source", "is_synthetic", "vwap_method", 
-                          "provider_request_id", "source_session", "timestamp"]
-        
-        for field in required_fields:
-            if field not in provenance:
-                print(f"[FAIL] Missing provenance field: {field}")
-                return False
-        
-        print("[PASS] Provenance data creation works correctly")
-        
-    except Exception as e:
-        print(f"[FAIL] Provenance creation failed: {e}")
-        return False
-    
-    print("\n" + "=" * 40)
-    print("All production safety tests PASSED")
-    print("The system correctly prevents stub execution in production!")
-    return True
-
-
-def test_calc_levels_integration():
-    """Test that calc_levels would fail in production mode"""
-    
-    print("\n\nCalc-Levels Production Safety Test")
-    print("=" * 40)
-    
-    # Set production mode
-    os.environ['FAIL_ON_STUB'] = '1'
-    
-    try:
-        # Import the calc_levels function
-        sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-        
-        print("Testing calc_levels in production mode...")
-        # Import here to avoid logging conflicts
-        import start
+        pytest.skip(f"Could not import calc_levels (expected in test environment): {e}")
+
+    # Any explicit failure counts; the expected codes are E-STUB-PATH,
+    # E-NODATA-DAILY, E-NODATA-INTRADAY or E-INVALID-DATE
+    with pytest.raises(SystemExit):
         start.calc_levels("/NQ", "2025-08-18", "json")
-        
-        print("[FAIL] calc_levels should have failed in production mode")
-        return False
-        
-    except SystemExit as e:
-        error_msg = str(e)
-        if any(code in error_msg for code in ["E-STUB-PATH", "E-NODATA-DAILY", "E-NODATA-INTRADAY", "E-INVALID-DATE"]):
-            print(f"[PASS] calc_levels correctly failed in production: {error_msg}")
-            return True
-        else:
-            print(f"[UNKNOWN] calc_levels failed with: {error_msg}")
-            return True  # Still counts as working since it failed
-            
-    except ImportError as e:
-        print(f"[SKIP] Could not import calc_levels (expected in test environment): {e}")
-        return True  # Skip this test in isolated environments
-        
-    except Exception as e:
-        print(f"[ERROR] Unexpected error: {e}")
-        return False
-
-
-if __name__ == "__main__":
-    success = test_production_safety()
-    
-    if success:
-        success = test_calc_levels_integration()
-    
-    if success:
-        print("\n" + "="*60)
-        print("PRODUCTION SAFETY SYSTEM VERIFICATION: PASSED")
-        print("="*60)
-        print()
-        print("Key findings:")
-        print("- Guardrails prevent stub execution when FAIL_ON_STUB=1")
-        print("- Production mode blocks calc_levels from using synthetic data")
-        print("- Provenance tracking system is functional") 
-        print("- System fails explicitly rather than providing fake data")
-        print()
-        print("These tests would have caught the original issue where")
-        print("synthetic stub data was silently presented as real market data!")
-        sys.exit(0)
-    else:
-        print("\n" + "="*60)
-        print("PRODUCTION SAFETY SYSTEM VERIFICATION: FAILED")
-        print("="*60)
-        sys.exit(1)
@@ -8,13 +8,36 @@
 """
 
 import asyncio
+import collections
+import functools
 import sys
 import json
-from typing import Dict, List, Any, Optional, Tuple
+from typing import AsyncIterator, Dict, List, Any, Optional
 from datetime import datetime, timedelta, date
 from pathlib import Path
 import logging
 
+import numpy as np
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize verification results as indented JSON bytes"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str)
+
+    def _dumps_line(obj: Any) -> bytes:
+        """Serialize one verification result as a newline-terminated JSON line"""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY, default=str)
+except ImportError:  # orjson is optional
+    def _dumps(obj: Any) -> bytes:
+        """Serialize verification results as indented JSON bytes"""
+        return json.dumps(obj, indent=2, default=str).encode()
+
+    def _dumps_line(obj: Any) -> bytes:
+        """Serialize one verification result as a newline-terminated JSON line"""
+        return json.dumps(obj, default=str).encode() + b'\n'
+
 # Add the app directory to Python path
 app_dir = Path(__file__).parent / "app"
 sys.path.insert(0, str(app_dir))
@@ -33,20 +56,141 @@
 logger = logging.getLogger(__name__)
 
 
+# Emoji decorations are only worth their bytes on an interactive terminal
+_TTY = sys.stdout.isatty()
+
+
+def _p(msg: str, *, emoji: str = '') -> None:
+    """Print ``msg``, prefixed with ``emoji`` only when stdout is a TTY"""
+    if _TTY and emoji:
+        body = msg.lstrip('\n')
+        msg = f"{msg[:len(msg) - len(body)]}{emoji} {body}"
+    print(msg)
+
+
+# Verification methods in run order and their weights in the confidence score
+_METHOD_KEYS = (
+    "schema_validation",
+    "mathematical_consistency",
+    "quote_cross_validation",
+    "trend_analysis",
+    "market_reasonableness",
+    "pivot_verification",
+)
+_WEIGHTS = np.array([0.15, 0.25, 0.20, 0.15, 0.15, 0.10])
+
+# One OHLC bar with prices parsed once and shared by the validation methods
+OHLC = collections.namedtuple('OHLC', 'H L O C V vwap dt')
+
+
+def _optional_number(value: Any, cast) -> Any:
+    """``cast(value)``, or None when the value is missing or not a number"""
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _coerce_ohlc(d: Dict[str, Any]) -> OHLC:
+    """Parse the numeric fields of an OHLC record into an ``OHLC`` tuple
+
+    Prices are required (schema validation has already checked them).
+    Volume and VWAP are optional and become None when unusable, so only
+    the checks that need them report an error.
+    """
+    return OHLC(
+        float(d['high']),
+        float(d['low']),
+        float(d['open']),
+        float(d['close']),
+        _optional_number(d.get('volume', 0), int),
+        _optional_number(d.get('vwap', d['close']), float),
+        d.get('datetime', ''),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp (trailing 'Z' accepted), or None if invalid
+
+    Cached because bars of the same day share the same date string.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _xlate(symbol: str) -> str:
+    """Front-month translation of ``symbol``, upper-cased (cached per process)"""
+    return translate_root_to_front_month(symbol).upper()
+
+
+@functools.lru_cache(maxsize=256)
+def _asset_class(symbol: str) -> str:
+    """Classify ``symbol`` as 'futures' or 'stock' for reasonableness ranges"""
+    if symbol.startswith('/') or 'NQ' in symbol or 'ES' in symbol:
+        return 'futures'
+    return 'stock'
+
+
+@functools.lru_cache(maxsize=1)
+def _get_clients():
+    """Config, auth and API clients shared by every verifier in the process
+
+    Built on first use so repeated verifications reuse the same auth state
+    and HTTP client instead of re-reading config each time.
+    """
+    config = Config()
+    auth_manager = AuthManager(config)
+    return (
+        config,
+        auth_manager,
+        HistoricalInterface(config, auth_manager),
+        QuotesInterface(config, auth_manager),
+        S.SchwabClient(auth=auth_manager, config=config),
+    )
+
+
 class OHLCVerifier:
     """Comprehensive OHLC data verification system"""
     
     def __init__(self):
-        self.config = Config()
-        self.auth_manager = AuthManager(self.config)
-        self.historical = HistoricalInterface(self.config, self.auth_manager)
-        self.quotes = QuotesInterface(self.config, self.auth_manager)
-        self.schwab_client = S.SchwabClient(auth=self.auth_manager, config=self.config)
+        (self.config, self.auth_manager, self.historical,
+         self.quotes, self.schwab_client) = _get_clients()
+    
+    async def verify_many(self, symbols: List[str], target_date: str) -> List[Dict[str, Any]]:
+        """Verify several symbols, fetching their current quotes in one request"""
+        return [result async for result in self.iter_verify_many(symbols, target_date)]
     
-    async def verify_ohlc_data(self, symbol: str, target_date: str) -> Dict[str, Any]:
+    async def iter_verify_many(self, symbols: List[str], target_date: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the verification result of each symbol as soon as it is done
+        
+        Quotes for all symbols are fetched in one request up front; falls back
+        to per-symbol quote requests if the batch request fails.
+        """
+        quotes_map: Dict[str, Dict[str, Any]] = {}
+        try:
+            quotes_result = await self.schwab_client.quotes([_xlate(s) for s in symbols])
+            quotes_map = {r['symbol']: r for r in (quotes_result or {}).get('records') or []}
+            prefetched = True
+        except Exception as e:
+            logger.warning(f"Batch quote request failed, fetching per symbol: {e}")
+            prefetched = False
+        
+        for symbol in symbols:
+            quote = quotes_map.get(_xlate(symbol), {}) if prefetched else None
+            yield await self.verify_ohlc_data(symbol, target_date, quote=quote)
+    
+    async def verify_ohlc_data(self, symbol: str, target_date: str,
+                               quote: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Comprehensive OHLC data verification using multiple methods
         
+        ``quote`` is a prefetched quote record for the symbol (``{}`` if none
+        was returned); when omitted the quote is fetched here.
+        
         Methods:
         1. Schema validation
         2. Mathematical consistency checks  
@@ -56,8 +200,9 @@ async def verify_ohlc_data(self, symbol: str, target_date: str) -> Dict[str, Any
         6. Multiple source verification
         """
         
-        print(f"\n🔍 VERIFYING OHLC DATA FOR {symbol} ON {target_date}")
-        print("=" * 60)
+        if _TTY:
+            _p(f"\nVERIFYING OHLC DATA FOR {symbol} ON {target_date}", emoji="🔍")
+            print("=" * 60)
         
         verification_results = {
             "symbol": symbol,
@@ -71,167 +216,185 @@ async def verify_ohlc_data(self, symbol: str, target_date: str) -> Dict[str, Any
         
         try:
             # Translate symbol
-            translated_symbol = translate_root_to_front_month(symbol).upper()
-            print(f"📝 Translated symbol: {symbol} -> {translated_symbol}")
+            translated_symbol = _xlate(symbol)
+            _p(f"Translated symbol: {symbol} -> {translated_symbol}", emoji="📝")
             
             # Get historical data
             ohlc_data = await self.historical.get_latest_ohlc(translated_symbol, '1D', 3)
             
             if not ohlc_data:
-                print("❌ No historical data available")
+                _p("No historical data available", emoji="❌")
                 return verification_results
             
             recent_data = ohlc_data[0]  # Most recent record
             verification_results["raw_data"] = recent_data
             verification_results["data_source"] = "historical_interface"
             
-            print(f"📊 Retrieved OHLC: H={recent_data['high']}, L={recent_data['low']}, C={recent_data['close']}, O={recent_data['open']}")
+            _p(f"Retrieved OHLC: H={recent_data['high']}, L={recent_data['low']}, C={recent_data['close']}, O={recent_data['open']}", emoji="📊")
             
-            # Method 1: Schema Validation
+            # Method 1: Schema Validation - a structurally invalid record
+            # fails fast without running the remaining checks
             schema_result = await self._validate_schema([recent_data])
             verification_results["methods"]["schema_validation"] = schema_result
+            if schema_result["score"] == 0.0:
+                _p("\nSchema validation failed - skipping remaining checks", emoji="❌")
+                return verification_results
             
-            # Method 2: Mathematical Consistency
-            math_result = await self._validate_mathematical_consistency(recent_data)
-            verification_results["methods"]["mathematical_consistency"] = math_result
-            
-            # Method 3: Cross-validation with Real-time Quotes
-            quote_result = await self._cross_validate_with_quotes(translated_symbol, recent_data)
-            verification_results["methods"]["quote_cross_validation"] = quote_result
-            
-            # Method 4: Historical Trend Analysis
-            trend_result = await self._validate_historical_trends(ohlc_data)
-            verification_results["methods"]["trend_analysis"] = trend_result
-            
-            # Method 5: Market Reasonableness
-            market_result = await self._validate_market_reasonableness(recent_data, symbol)
-            verification_results["methods"]["market_reasonableness"] = market_result
-            
-            # Method 6: Pivot Point Verification
-            pivot_result = await self._verify_pivot_calculations(recent_data)
-            verification_results["methods"]["pivot_verification"] = pivot_result
+            rec = _coerce_ohlc(recent_data)
+            
+            # Methods 2-6 run concurrently so the quote fetch overlaps the
+            # CPU-only checks
+            method_results = await asyncio.gather(
+                self._validate_mathematical_consistency(rec),                # Method 2
+                self._cross_validate_with_quotes(translated_symbol, rec, quote),  # Method 3
+                self._validate_historical_trends(ohlc_data),                 # Method 4
+                self._validate_market_reasonableness(rec, symbol),           # Method 5
+                self._verify_pivot_calculations(rec),                        # Method 6
+                return_exceptions=True,
+            )
+            for name, result in zip(_METHOD_KEYS[1:], method_results):
+                if isinstance(result, BaseException):
+                    result = {"status": "ERROR", "score": 0.0, "error": str(result)}
+                verification_results["methods"][name] = result
             
             # Calculate overall confidence score
             confidence_score = self._calculate_confidence_score(verification_results["methods"])
             verification_results["overall_confidence"] = confidence_score
             
-            print(f"\n📈 OVERALL CONFIDENCE SCORE: {confidence_score:.1%}")
+            statuses = ", ".join(f"{name}={result.get('status')}" for name, result in verification_results["methods"].items())
+            _p(f"\nOVERALL CONFIDENCE SCORE: {confidence_score:.1%} ({statuses})", emoji="📈")
             
         except Exception as e:
-            print(f"❌ Verification failed: {e}")
+            _p(f"Verification failed: {e}", emoji="❌")
             verification_results["error"] = str(e)
         
         return verification_results
     
     async def _validate_schema(self, ohlc_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate OHLC data against schema requirements"""
-        print("\n1️⃣ SCHEMA VALIDATION")
-        print("-" * 20)
+        logger.debug("\n1️⃣ SCHEMA VALIDATION")
+        logger.debug("-" * 20)
         
         try:
             # Use built-in OHLC validation
             validation_result = validate_ohlc_data(ohlc_data)
             
             if validation_result['is_valid']:
-                print("✅ Schema validation passed")
+                logger.debug("✅ Schema validation passed")
                 return {"status": "PASS", "score": 1.0, "details": validation_result}
             else:
-                print(f"❌ Schema validation failed: {validation_result.get('errors', [])}")
+                logger.debug(f"❌ Schema validation failed: {validation_result.get('errors', [])}")
                 return {"status": "FAIL", "score": 0.0, "details": validation_result}
         except Exception as e:
-            print(f"❌ Schema validation error: {e}")
+            logger.warning(f"❌ Schema validation error: {e}")
             return {"status": "ERROR", "score": 0.0, "error": str(e)}
     
-    async def _validate_mathematical_consistency(self, ohlc_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_mathematical_consistency_batch(self, records: List[OHLC]) -> List[Dict[str, Any]]:
+        """Validate mathematical consistency of many OHLC records at once
+
+        The checks are evaluated as array operations over all records; the
+        per-record result has the same shape as the single-record check.
+        Records are ``OHLC`` tuples as returned by ``_coerce_ohlc``.
+        """
+        arr = np.array([r[:4] for r in records], dtype=np.float64).reshape(-1, 4)
+        H, L, O, C = arr.T
+        max_oc = np.maximum(O, C)
+        min_oc = np.minimum(O, C)
+
+        # Check: High >= max(Open, Close)
+        bad_high = H < max_oc
+        # Check: Low <= min(Open, Close)
+        bad_low = L > min_oc
+        # Check: All prices positive
+        bad_pos = arr.min(axis=1) <= 0
+        # Check: Reasonable daily range (not more than 50% move)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rng = np.where(min_oc > 0, (H - L) / min_oc, 0.0)
+        bad_rng = rng > 0.5  # 50% daily range seems excessive
+
+        scores = np.clip(1.0 - 0.3 * bad_high - 0.3 * bad_low - 0.4 * bad_pos - 0.2 * bad_rng, 0.0, None)
+
+        results = []
+        for i, (h, l, o, c) in enumerate(arr.tolist()):
+            issues = []
+            if bad_high[i]:
+                issues.append(f"High ({h}) less than max(Open={o}, Close={c})")
+            if bad_low[i]:
+                issues.append(f"Low ({l}) greater than min(Open={o}, Close={c})")
+            if bad_pos[i]:
+                issues.append("Non-positive prices detected")
+            if bad_rng[i]:
+                issues.append(f"Unusually large daily range: {rng[i]:.1%}")
+
+            score = float(scores[i])
+            results.append({
+                "status": "PASS" if score >= 0.7 else "WARN" if score >= 0.4 else "FAIL",
+                "score": score,
+                "issues": issues,
+                "daily_range": float(rng[i]),
+                "ohlc": {"H": h, "L": l, "O": o, "C": c}
+            })
+        return results
+
+    async def _validate_mathematical_consistency(self, rec: OHLC) -> Dict[str, Any]:
         """Validate mathematical consistency of OHLC values"""
-        print("\n2️⃣ MATHEMATICAL CONSISTENCY")
-        print("-" * 30)
+        logger.debug("\n2️⃣ MATHEMATICAL CONSISTENCY")
+        logger.debug("-" * 30)
         
         try:
-            H = float(ohlc_data['high'])
-            L = float(ohlc_data['low'])
-            O = float(ohlc_data['open'])
-            C = float(ohlc_data['close'])
-            
-            issues = []
-            score = 1.0
-            
-            # Check: High >= max(Open, Close)
-            if H < max(O, C):
-                issues.append(f"High ({H}) less than max(Open={O}, Close={C})")
-                score -= 0.3
-            
-            # Check: Low <= min(Open, Close)
-            if L > min(O, C):
-                issues.append(f"Low ({L}) greater than min(Open={O}, Close={C})")
-                score -= 0.3
-            
-            # Check: All prices positive
-            if any(price <= 0 for price in [H, L, O, C]):
-                issues.append("Non-positive prices detected")
-                score -= 0.4
-            
-            # Check: Reasonable daily range (not more than 50% move)
-            daily_range = (H - L) / min(O, C) if min(O, C) > 0 else 0
-            if daily_range > 0.5:  # 50% daily range seems excessive
-                issues.append(f"Unusually large daily range: {daily_range:.1%}")
-                score -= 0.2
+            result = self._validate_mathematical_consistency_batch([rec])[0]
             
-            score = max(0.0, score)
-            
-            if not issues:
-                print("✅ Mathematical consistency verified")
-                print(f"   Range: {daily_range:.1%} (H={H}, L={L}, O={O}, C={C})")
+            if not result["issues"]:
+                ohlc = result["ohlc"]
+                logger.debug("✅ Mathematical consistency verified")
+                logger.debug(f"   Range: {result['daily_range']:.1%} (H={ohlc['H']}, L={ohlc['L']}, O={ohlc['O']}, C={ohlc['C']})")
             else:
-                print(f"⚠️  Issues found: {', '.join(issues)}")
+                logger.debug(f"⚠️  Issues found: {', '.join(result['issues'])}")
             
-            return {
-                "status": "PASS" if score >= 0.7 else "WARN" if score >= 0.4 else "FAIL",
-                "score": score,
-                "issues": issues,
-                "daily_range": daily_range,
-                "ohlc": {"H": H, "L": L, "O": O, "C": C}
-            }
+            return result
             
         except Exception as e:
-            print(f"❌ Math consistency error: {e}")
+            logger.warning(f"❌ Math consistency error: {e}")
             return {"status": "ERROR", "score": 0.0, "error": str(e)}
     
-    async def _cross_validate_with_quotes(self, symbol: str, ohlc_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _cross_validate_with_quotes(self, symbol: str, rec: OHLC,
+                                          quote: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Cross-validate historical data with current quotes"""
-        print("\n3️⃣ QUOTE CROSS-VALIDATION")
-        print("-" * 26)
+        logger.debug("\n3️⃣ QUOTE CROSS-VALIDATION")
+        logger.debug("-" * 26)
         
         try:
-            # Get current quote
-            quotes_result = await self.schwab_client.quotes([symbol])
-            
-            if not quotes_result or 'records' not in quotes_result or not quotes_result['records']:
-                print("⚠️  No quote data available for cross-validation")
+            # Get current quote unless it was prefetched
+            if quote is None:
+                quotes_result = await self.schwab_client.quotes([symbol])
+                records = (quotes_result or {}).get('records')
+                quote = records[0] if records else None
+            
+            if not quote:
+                logger.debug("⚠️  No quote data available for cross-validation")
                 return {"status": "SKIP", "score": 0.5, "reason": "No quote data"}
             
-            quote = quotes_result['records'][0]
             current_bid = float(quote.get('bid', 0))
             current_ask = float(quote.get('ask', 0))
             current_mid = (current_bid + current_ask) / 2.0 if current_bid > 0 and current_ask > 0 else 0
             
-            historical_close = float(ohlc_data['close'])
+            historical_close = rec.C
             
             # Compare current price to historical close
             if current_mid > 0:
                 price_diff = abs(current_mid - historical_close) / historical_close
-                print(f"📊 Current mid: {current_mid:.2f}, Historical close: {historical_close:.2f}")
-                print(f"📈 Price difference: {price_diff:.1%}")
+                logger.debug(f"📊 Current mid: {current_mid:.2f}, Historical close: {historical_close:.2f}")
+                logger.debug(f"📈 Price difference: {price_diff:.1%}")
                 
                 # Reasonable if within 10% (markets can move significantly)
                 if price_diff <= 0.10:
-                    print("✅ Current price aligns with historical close")
+                    logger.debug("✅ Current price aligns with historical close")
                     score = 1.0
                 elif price_diff <= 0.25:
-                    print("⚠️  Moderate price divergence from historical")
+                    logger.debug("⚠️  Moderate price divergence from historical")
                     score = 0.7
                 else:
-                    print("❌ Large price divergence - data may be stale/incorrect")
+                    logger.debug("❌ Large price divergence - data may be stale/incorrect")
                     score = 0.3
                 
                 return {
@@ -242,44 +405,44 @@ async def _cross_validate_with_quotes(self, symbol: str, ohlc_data: Dict[str, An
                     "price_diff_pct": price_diff
                 }
             else:
-                print("⚠️  Invalid current quote data")
+                logger.debug("⚠️  Invalid current quote data")
                 return {"status": "WARN", "score": 0.5, "reason": "Invalid quote"}
                 
         except Exception as e:
-            print(f"❌ Quote cross-validation error: {e}")
+            logger.warning(f"❌ Quote cross-validation error: {e}")
             return {"status": "ERROR", "score": 0.0, "error": str(e)}
     
     async def _validate_historical_trends(self, ohlc_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Validate data against historical trends"""
-        print("\n4️⃣ HISTORICAL TREND ANALYSIS")
-        print("-" * 30)
+        logger.debug("\n4️⃣ HISTORICAL TREND ANALYSIS")
+        logger.debug("-" * 30)
         
         try:
             if len(ohlc_data) < 2:
-                print("⚠️  Insufficient historical data for trend analysis")
+                logger.debug("⚠️  Insufficient historical data for trend analysis")
                 return {"status": "SKIP", "score": 0.5, "reason": "Insufficient data"}
             
-            # Calculate day-to-day changes
-            recent = ohlc_data[0]
-            previous = ohlc_data[1] if len(ohlc_data) > 1 else None
+            # Calculate day-to-day changes (records are most recent first)
+            closes = np.asarray([day['close'] for day in ohlc_data], dtype=np.float64)
+            if not np.isfinite(closes).all():
+                raise ValueError("Non-finite close price in trend data")
+            if len(closes) >= 3 and (closes[1:] == 0).any():
+                raise ZeroDivisionError("Zero close price in trend data")
+            # Only a zero previous close (two bars) can divide by zero here,
+            # and daily_change falls back to 0 for it
+            with np.errstate(divide='ignore', invalid='ignore'):
+                changes = (closes[:-1] - closes[1:]) / closes[1:]
             
-            if not previous:
-                return {"status": "SKIP", "score": 0.5, "reason": "No previous day data"}
-            
-            recent_close = float(recent['close'])
-            prev_close = float(previous['close'])
-            daily_change = (recent_close - prev_close) / prev_close if prev_close > 0 else 0
+            daily_change = float(changes[0]) if closes[1] > 0 else 0
             
             # Calculate volatility
-            closes = [float(day['close']) for day in ohlc_data]
             if len(closes) >= 3:
-                changes = [(closes[i] - closes[i+1]) / closes[i+1] for i in range(len(closes)-1)]
-                avg_volatility = sum(abs(change) for change in changes) / len(changes)
+                avg_volatility = float(np.abs(changes).mean())
             else:
                 avg_volatility = abs(daily_change)
             
-            print(f"📊 Daily change: {daily_change:.1%}")
-            print(f"📈 Average volatility: {avg_volatility:.1%}")
+            logger.debug(f"📊 Daily change: {daily_change:.1%}")
+            logger.debug(f"📈 Average volatility: {avg_volatility:.1%}")
             
             # Score based on reasonableness
             score = 1.0
@@ -296,9 +459,9 @@ async def _validate_historical_trends(self, ohlc_data: List[Dict[str, Any]]) ->
             score = max(0.0, score)
             
             if not issues:
-                print("✅ Historical trend analysis normal")
+                logger.debug("✅ Historical trend analysis normal")
             else:
-                print(f"⚠️  Issues: {', '.join(issues)}")
+                logger.debug(f"⚠️  Issues: {', '.join(issues)}")
             
             return {
                 "status": "PASS" if score >= 0.7 else "WARN",
@@ -309,62 +472,59 @@ async def _validate_historical_trends(self, ohlc_data: List[Dict[str, Any]]) ->
             }
             
         except Exception as e:
-            print(f"❌ Trend analysis error: {e}")
+            logger.warning(f"❌ Trend analysis error: {e}")
             return {"status": "ERROR", "score": 0.0, "error": str(e)}
     
-    async def _validate_market_reasonableness(self, ohlc_data: Dict[str, Any], symbol: str) -> Dict[str, Any]:
+    async def _validate_market_reasonableness(self, rec: OHLC, symbol: str) -> Dict[str, Any]:
         """Validate data for market reasonableness"""
-        print("\n5️⃣ MARKET REASONABLENESS")
-        print("-" * 24)
+        logger.debug("\n5️⃣ MARKET REASONABLENESS")
+        logger.debug("-" * 24)
         
         try:
-            close_price = float(ohlc_data['close'])
-            volume = int(ohlc_data.get('volume', 0))
+            close_price = rec.C
+            volume = rec.V
+            if volume is None:
+                raise ValueError("volume is missing or not a number")
             
             score = 1.0
             issues = []
             
             # Price reasonableness for different asset types
-            if symbol.startswith('/') or 'NQ' in symbol or 'ES' in symbol:
+            if _asset_class(symbol) == 'futures':
                 # Futures - check for reasonable index levels
                 if close_price < 1000 or close_price > 50000:
                     issues.append(f"Unusual futures price: {close_price}")
                     score -= 0.3
-                print(f"📊 Futures price: {close_price} (reasonable range check)")
+                logger.debug(f"📊 Futures price: {close_price} (reasonable range check)")
             else:
                 # Stocks - check for reasonable stock prices
                 if close_price < 0.01 or close_price > 10000:
                     issues.append(f"Unusual stock price: {close_price}")
                     score -= 0.3
-                print(f"📊 Stock price: {close_price} (reasonable range check)")
+                logger.debug(f"📊 Stock price: {close_price} (reasonable range check)")
             
             # Volume reasonableness
             if volume > 0:
                 if volume > 1000000000:  # 1B shares seems excessive
                     issues.append(f"Extremely high volume: {volume:,}")
                     score -= 0.2
-                print(f"📈 Volume: {volume:,}")
+                logger.debug(f"📈 Volume: {volume:,}")
             else:
-                print("⚠️  No volume data available")
+                logger.debug("⚠️  No volume data available")
                 score -= 0.1
             
             # Check if trading day (basic check)
-            data_date = ohlc_data.get('datetime', '')
-            if data_date:
-                try:
-                    dt = datetime.fromisoformat(data_date.replace('Z', '+00:00'))
-                    if dt.weekday() >= 5:  # Saturday=5, Sunday=6
-                        issues.append("Data from weekend (possible holiday/error)")
-                        score -= 0.2
-                except:
-                    pass
+            dt = _parse_iso(rec.dt) if isinstance(rec.dt, str) and rec.dt else None
+            if dt is not None and dt.weekday() >= 5:  # Saturday=5, Sunday=6
+                issues.append("Data from weekend (possible holiday/error)")
+                score -= 0.2
             
             score = max(0.0, score)
             
             if not issues:
-                print("✅ Market reasonableness checks passed")
+                logger.debug("✅ Market reasonableness checks passed")
             else:
-                print(f"⚠️  Issues: {', '.join(issues)}")
+                logger.debug(f"⚠️  Issues: {', '.join(issues)}")
             
             return {
                 "status": "PASS" if score >= 0.7 else "WARN",
@@ -375,29 +535,28 @@ async def _validate_market_reasonableness(self, ohlc_data: Dict[str, Any], symbo
             }
             
         except Exception as e:
-            print(f"❌ Market reasonableness error: {e}")
+            logger.warning(f"❌ Market reasonableness error: {e}")
             return {"status": "ERROR", "score": 0.0, "error": str(e)}
     
-    async def _verify_pivot_calculations(self, ohlc_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _verify_pivot_calculations(self, rec: OHLC) -> Dict[str, Any]:
         """Verify pivot point calculations"""
-        print("\n6️⃣ PIVOT POINT VERIFICATION")
-        print("-" * 28)
+        logger.debug("\n6️⃣ PIVOT POINT VERIFICATION")
+        logger.debug("-" * 28)
         
         try:
-            H = float(ohlc_data['high'])
-            L = float(ohlc_data['low'])
-            C = float(ohlc_data['close'])
-            vwap = float(ohlc_data.get('vwap', C))
+            H, L, C, vwap = rec.H, rec.L, rec.C, rec.vwap
+            if vwap is None:
+                raise ValueError("vwap is missing or not a number")
             
             # Calculate pivot levels
             pivot = (H + L + C) / 3.0
             r1 = 2 * pivot - L
             s1 = 2 * pivot - H
             
-            print(f"📊 Calculated Pivot: {pivot:.4f}")
-            print(f"📈 R1 (Resistance): {r1:.4f}")
-            print(f"📉 S1 (Support): {s1:.4f}")
-            print(f"⚖️  VWAP: {vwap:.4f}")
+            logger.debug(f"📊 Calculated Pivot: {pivot:.4f}")
+            logger.debug(f"📈 R1 (Resistance): {r1:.4f}")
+            logger.debug(f"📉 S1 (Support): {s1:.4f}")
+            logger.debug(f"⚖️  VWAP: {vwap:.4f}")
             
             # Verify calculations make sense
             score = 1.0
@@ -423,9 +582,9 @@ async def _verify_pivot_calculations(self, ohlc_data: Dict[str, Any]) -> Dict[st
             score = max(0.0, score)
             
             if not issues:
-                print("✅ Pivot calculations verified")
+                logger.debug("✅ Pivot calculations verified")
             else:
-                print(f"⚠️  Issues: {', '.join(issues)}")
+                logger.debug(f"⚠️  Issues: {', '.join(issues)}")
             
             return {
                 "status": "PASS" if score >= 0.7 else "WARN",
@@ -439,31 +598,23 @@ async def _verify_pivot_calculations(self, ohlc_data: Dict[str, Any]) -> Dict[st
             }
             
         except Exception as e:
-            print(f"❌ Pivot verification error: {e}")
+            logger.warning(f"❌ Pivot verification error: {e}")
             return {"status": "ERROR", "score": 0.0, "error": str(e)}
     
     def _calculate_confidence_score(self, methods: Dict[str, Any]) -> float:
         """Calculate overall confidence score from all methods"""
         
-        # Weights for different validation methods
-        weights = {
-            "schema_validation": 0.15,
-            "mathematical_consistency": 0.25,
-            "quote_cross_validation": 0.20,
-            "trend_analysis": 0.15,
-            "market_reasonableness": 0.15,
-            "pivot_verification": 0.10
-        }
-        
-        total_score = 0.0
-        total_weight = 0.0
+        # A failed schema check means the record can't be trusted at all
+        if methods.get("schema_validation", {}).get("score") == 0.0:
+            return 0.0
         
-        for method, weight in weights.items():
-            if method in methods and "score" in methods[method]:
-                total_score += methods[method]["score"] * weight
-                total_weight += weight
+        # Only methods that produced a score contribute to the weighting
+        scored = np.array([k in methods and "score" in methods[k] for k in _METHOD_KEYS])
+        scores = np.array([methods[k]["score"] if ok else 0.0 for k, ok in zip(_METHOD_KEYS, scored)])
+        w = _WEIGHTS * scored
+        total_weight = w.sum()
         
-        return total_score / total_weight if total_weight > 0 else 0.0
+        return float(np.dot(scores, w) / total_weight) if total_weight > 0 else 0.0
 
 
 async def main():
@@ -471,36 +622,76 @@ async def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='Verify OHLC data accuracy')
-    parser.add_argument('--symbol', required=True, help='Symbol to verify (e.g., /NQ, AAPL)')
+    parser.add_argument('--symbol', required=True, action='append',
+                        help='Symbol to verify (e.g., /NQ, AAPL); repeat or comma-separate for several')
     parser.add_argument('--date', required=True, help='Date to verify (YYYY-MM-DD)')
     parser.add_argument('--output', choices=['console', 'json'], default='console', help='Output format')
     parser.add_argument('--save', help='Save results to file')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='Write one JSON line per symbol as each verification finishes')
+    parser.add_argument('--verbose', action='store_true', help='Show the details of each verification method')
     
     args = parser.parse_args()
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
     
-    verifier = OHLCVerifier()
-    results = await verifier.verify_ohlc_data(args.symbol, args.date)
+    symbols = [s.strip() for arg in args.symbol for s in arg.split(',') if s.strip()]
+    if not symbols:
+        parser.error('--symbol must name at least one symbol')
     
-    if args.output == 'json':
-        print(json.dumps(results, indent=2, default=str))
-    
-    if args.save:
-        with open(args.save, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        print(f"\n💾 Results saved to {args.save}")
+    verifier = OHLCVerifier()
+    if args.ndjson:
+        # Stream results instead of holding them all in memory
+        confidence = 1.0
+        out = open(args.save, 'wb') if args.save else None
+        try:
+            async for result in verifier.iter_verify_many(symbols, args.date):
+                line = _dumps_line(result)
+                if out is not None:
+                    out.write(line)
+                    out.flush()
+                if args.output == 'json':
+                    sys.stdout.write(line.decode())
+                confidence = min(confidence, result.get('overall_confidence', 0.0))
+        finally:
+            if out is not None:
+                out.close()
+        if args.save:
+            _p(f"\nResults saved to {args.save}", emoji="💾")
+    else:
+        if len(symbols) == 1:
+            results = await verifier.verify_ohlc_data(symbols[0], args.date)
+            confidence = results.get('overall_confidence', 0.0)
+        else:
+            results = await verifier.verify_many(symbols, args.date)
+            confidence = min(r.get('overall_confidence', 0.0) for r in results)
+        
+        if args.output == 'json':
+            print(_dumps(results).decode())
+        
+        if args.save:
+            with open(args.save, 'wb') as f:
+                f.write(_dumps(results))
+            _p(f"\nResults saved to {args.save}", emoji="💾")
     
-    # Return exit code based on confidence
-    confidence = results.get('overall_confidence', 0.0)
+    # Return exit code based on confidence (the lowest one for several symbols)
     if confidence >= 0.8:
-        print(f"\n🎉 HIGH CONFIDENCE ({confidence:.1%}) - Data appears reliable")
+        _p(f"\nHIGH CONFIDENCE ({confidence:.1%}) - Data appears reliable", emoji="🎉")
         return 0
     elif confidence >= 0.6:
-        print(f"\n⚠️  MODERATE CONFIDENCE ({confidence:.1%}) - Use with caution")
+        _p(f"\nMODERATE CONFIDENCE ({confidence:.1%}) - Use with caution", emoji="⚠️")
         return 1
     else:
-        print(f"\n❌ LOW CONFIDENCE ({confidence:.1%}) - Data may be unreliable")
+        _p(f"\nLOW CONFIDENCE ({confidence:.1%}) - Data may be unreliable", emoji="❌")
         return 2
 
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    run = asyncio.run
+    if sys.platform != 'win32':
+        try:
+            import uvloop  # optional libuv-based event loop
+            run = uvloop.run
+        except ImportError:
+            pass
+    sys.exit(run(main()))